@@ -1,13 +1,41 @@
 """Reusable helpers for the Doc AI Analysis Starter template."""
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 try:
     from ._version import version as __version__
 except ImportError:  # pragma: no cover
     __version__ = "0.0.0"
 
-from .converter import OutputFormat, convert_file, convert_files, suffix_for_format
-from .github import build_vector_store, merge_pr, review_pr, run_prompt, validate_file
-from .metadata import DublinCoreDocument
+if TYPE_CHECKING:  # pragma: no cover - imported lazily at runtime
+    from .converter import OutputFormat, convert_file, convert_files, suffix_for_format
+    from .github import (
+        build_vector_store,
+        merge_pr,
+        review_pr,
+        run_prompt,
+        validate_file,
+    )
+    from .metadata import DublinCoreDocument
+
+# Public helpers and the submodule that defines them. They are imported on
+# first access so ``import doc_ai`` does not pull in the OpenAI client or
+# Docling until they are needed.
+_LAZY_ATTRS = {
+    "DublinCoreDocument": ".metadata",
+    "OutputFormat": ".converter",
+    "convert_file": ".converter",
+    "convert_files": ".converter",
+    "suffix_for_format": ".converter",
+    "validate_file": ".github",
+    "build_vector_store": ".github",
+    "run_prompt": ".github",
+    "review_pr": ".github",
+    "merge_pr": ".github",
+}
 
 __all__ = [
     "DublinCoreDocument",
@@ -22,3 +50,17 @@ __all__ = [
     "merge_pr",
     "__version__",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public helpers on first attribute access."""
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
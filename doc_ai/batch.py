@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 from pathlib import Path
 
 import click
@@ -14,6 +15,10 @@ from click_repl.utils import (  # type: ignore[import-untyped]
 
 from doc_ai import plugins
 
+# ``shlex`` only treats ASCII blanks as separators; ``str.split`` would also
+# split on Unicode whitespace such as non-breaking spaces.
+_SHLEX_WHITESPACE = re.compile(r"[ \t\r\n]+")
+
 
 def _parse_command(command: str) -> list[str] | None:
     """Parse a command line similar to the REPL parser."""
@@ -24,17 +29,20 @@ def _parse_command(command: str) -> list[str] | None:
         click.echo(result)
         return None
     try:
-        parts = split_arg_string(command, posix=False)
-        cleaned = []
-        for part in parts:
-            if (part.startswith("'") and not part.endswith("'")) or (
-                part.startswith('"') and not part.endswith('"')
-            ):
-                raise CommandLineParserError("No closing quotation")
-            if len(part) >= 2 and part[0] == part[-1] and part[0] in {'"', "'"}:
-                cleaned.append(part[1:-1])
-            else:
-                cleaned.append(part)
+        if '"' not in command and "'" not in command:
+            # Without quotes shlex only splits on whitespace, so skip it.
+            cleaned = [part for part in _SHLEX_WHITESPACE.split(command) if part]
+        else:
+            cleaned = []
+            for part in split_arg_string(command, posix=False):
+                if (part.startswith("'") and not part.endswith("'")) or (
+                    part.startswith('"') and not part.endswith('"')
+                ):
+                    raise CommandLineParserError("No closing quotation")
+                if len(part) >= 2 and part[0] == part[-1] and part[0] in {'"', "'"}:
+                    cleaned.append(part[1:-1])
+                else:
+                    cleaned.append(part)
         if cleaned and cleaned[0] in plugins.iter_repl_commands():
             plugins.iter_repl_commands()[cleaned[0]](cleaned[1:])
             return None
@@ -45,33 +53,34 @@ def _parse_command(command: str) -> list[str] | None:
 
 def run_batch(ctx: click.Context, path: Path) -> None:
     """Execute commands from *path* before starting the REPL."""
-    for lineno, raw in enumerate(path.read_text().splitlines(), start=1):
-        line = raw.strip()
-        if not line or line.startswith("#"):
-            continue
-        try:
-            args = _parse_command(line)
-        except CommandLineParserError as exc:
-            err = click.ClickException(f"{path}:{lineno}: {exc}")
-            err.exit_code = 1
-            raise err from exc
-        if args is None:
-            continue
-        sub_ctx: click.Context | None = None
-        try:
-            sub_ctx = ctx.command.make_context(
-                ctx.command.name,
-                args,
-                obj=ctx.obj,
-                default_map=ctx.default_map,
-            )
-            ctx.command.invoke(sub_ctx)
-        except click.ClickException as exc:
-            err = click.ClickException(f"{path}:{lineno}: {exc.format_message()}")
-            err.exit_code = exc.exit_code
-            raise err from exc
-        except ClickExit as exc:
-            raise typer.Exit(exc.exit_code)
-        finally:
-            if sub_ctx is not None:
-                ctx.default_map = sub_ctx.default_map
+    with path.open(encoding="utf-8") as fh:
+        for lineno, raw in enumerate(fh, start=1):
+            line = raw.strip()
+            if not line or line.startswith("#"):
+                continue
+            try:
+                args = _parse_command(line)
+            except CommandLineParserError as exc:
+                err = click.ClickException(f"{path}:{lineno}: {exc}")
+                err.exit_code = 1
+                raise err from exc
+            if args is None:
+                continue
+            sub_ctx: click.Context | None = None
+            try:
+                sub_ctx = ctx.command.make_context(
+                    ctx.command.name,
+                    args,
+                    obj=ctx.obj,
+                    default_map=ctx.default_map,
+                )
+                ctx.command.invoke(sub_ctx)
+            except click.ClickException as exc:
+                err = click.ClickException(f"{path}:{lineno}: {exc.format_message()}")
+                err.exit_code = exc.exit_code
+                raise err from exc
+            except ClickExit as exc:
+                raise typer.Exit(exc.exit_code)
+            finally:
+                if sub_ctx is not None:
+                    ctx.default_map = sub_ctx.default_map
@@ -12,20 +12,25 @@ import sys
 from enum import Enum
 from importlib.metadata import entry_points
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO, Iterator
 
 import click
 import typer
-import yaml
 from dotenv import dotenv_values, find_dotenv, load_dotenv
 from platformdirs import PlatformDirs
-from rich.console import Console
+from rich import get_console
 from typer import Typer
+from typer.core import TyperGroup
 from typer.main import get_command
 
+try:  # ``orjson`` is optional; fall back to the stdlib when unavailable
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
 import doc_ai.cli.interactive as interactive_module
 from doc_ai import __version__
-from doc_ai.converter import OutputFormat, convert_path  # noqa: F401
+from doc_ai.converter import OutputFormat  # noqa: F401
 from doc_ai.logging import configure_logging
 
 from .interactive import (
@@ -47,60 +52,237 @@ from .utils import (  # noqa: F401
 if __package__ in (None, ""):
     sys.path[0] = str(Path(__file__).resolve().parent.parent)
 
-ENV_FILE = find_dotenv(usecwd=True, raise_error_if_not_found=False) or ".env"
+
+def _find_env_file() -> str:
+    """Return the ``.env`` path for the current working directory.
+
+    The lookup is repeated on every call: ``find_dotenv`` searches parent
+    directories, whose contents can change without touching the cwd.
+    """
+    return find_dotenv(usecwd=True, raise_error_if_not_found=False) or ".env"
+
+
+ENV_FILE = _find_env_file()
 
 # Default vector size used when ``EMBED_DIMENSIONS`` is unset.
 DEFAULT_EMBED_DIMENSIONS = 1536
 
-console = Console()
+# Rich's process-wide console, shared with the logging handler.
+console = get_console()
+
+# Subcommands whose modules are only imported once the command is resolved.
+# Maps the command name to the module and attribute providing its Typer app or
+# command function.
+_LAZY_SUBCOMMANDS: dict[str, tuple[str, str]] = {
+    "config": ("doc_ai.cli.config", "app"),
+    "convert": ("doc_ai.cli.convert", "app"),
+    "validate": ("doc_ai.cli.validate", "app"),
+    "analyze": ("doc_ai.cli.analyze", "app"),
+    "embed": ("doc_ai.cli.embed", "app"),
+    "query": ("doc_ai.cli.query", "app"),
+    "init-workflows": ("doc_ai.cli.init_workflows", "app"),
+    "add": ("doc_ai.cli.add", "app"),
+    "urls": ("doc_ai.cli.manage_urls", "app"),
+    "set": ("doc_ai.cli.config", "set_defaults"),
+}
+
+
+def _build_subcommand(target: Any, name: str) -> click.Command:
+    """Return the Click command for a Typer app or function mounted as *name*."""
+    parent = Typer(add_completion=False)
+    if isinstance(target, Typer):
+        parent.add_typer(target, name=name)
+        group = get_command(parent)
+        assert isinstance(group, click.Group)
+        return group.commands[name]
+    parent.command(name)(target)
+    return get_command(parent)
+
+
+def _load_lazy_subcommand(name: str) -> click.Command:
+    """Import the module backing *name* and return its Click command."""
+    module_name, attr = _LAZY_SUBCOMMANDS[name]
+    return _build_subcommand(getattr(importlib.import_module(module_name), attr), name)
+
+
+class _LazyTyperGroup(TyperGroup):
+    """Root group resolving lazy subcommands and plugins on first use.
+
+    Plugins are only discovered when a command name is not built in or when
+    the full command list is requested (``--help`` and completion).
+    """
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        _ensure_plugins_registered()
+        names = super().list_commands(ctx)
+        names += [name for name in _LAZY_SUBCOMMANDS if name not in names]
+        return names + [name for name in _LOADED_PLUGINS if name not in names]
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        cmd = super().get_command(ctx, cmd_name)
+        if cmd is not None:
+            return cmd
+        if cmd_name in _LAZY_SUBCOMMANDS:
+            cmd = _load_lazy_subcommand(cmd_name)
+        else:
+            _ensure_plugins_registered()
+            plugin_app = _LOADED_PLUGINS.get(cmd_name)
+            if plugin_app is None:
+                return None
+            cmd = _build_subcommand(plugin_app, cmd_name)
+        self.add_command(cmd, cmd_name)
+        return cmd
+
+
 app: Typer = Typer(
+    cls=_LazyTyperGroup,
     help="Orchestrate conversion, validation, analysis and embedding generation.",
     add_completion=True,
 )
 
 dirs = PlatformDirs("doc_ai")
 GLOBAL_CONFIG_DIR = Path(dirs.user_config_dir)
-for ext in (".json", ".yaml", ".yml"):
-    candidate = GLOBAL_CONFIG_DIR / f"config{ext}"
-    if candidate.exists():
-        GLOBAL_CONFIG_PATH = candidate
-        break
-else:
-    GLOBAL_CONFIG_PATH = GLOBAL_CONFIG_DIR / "config.json"
+
+# YAML global configs are still honoured when present, but JSON is canonical.
+_YAML_SUFFIXES = (".yaml", ".yml")
+# Candidate global config file names in order of preference.
+_CONFIG_NAMES = ("config.json", "config.yaml", "config.yml")
+
+
+def _find_global_config(config_dir: Path) -> Path:
+    """Return the global config file in *config_dir*, preferring JSON."""
+    try:
+        with os.scandir(config_dir) as it:
+            names = {entry.name for entry in it if entry.name in _CONFIG_NAMES}
+    except OSError:
+        names = set()
+    for name in _CONFIG_NAMES:
+        if name in names:
+            return config_dir / name
+    return config_dir / "config.json"
+
+
+GLOBAL_CONFIG_PATH = _find_global_config(GLOBAL_CONFIG_DIR)
+
+
+def _config_load_failed(exc: Exception) -> dict[str, str]:
+    logger.warning(
+        "Failed to load global config from %s", GLOBAL_CONFIG_PATH, exc_info=exc
+    )
+    return {}
 
 
 def load_global_config() -> dict[str, str]:
-    if GLOBAL_CONFIG_PATH.exists():
+    try:
+        data = GLOBAL_CONFIG_PATH.read_bytes()
+    except FileNotFoundError:
+        return {}
+    except OSError as exc:
+        return _config_load_failed(exc)
+    if GLOBAL_CONFIG_PATH.suffix in _YAML_SUFFIXES:
+        import yaml
+
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
         try:
-            if GLOBAL_CONFIG_PATH.suffix in {".yaml", ".yml"}:
-                return yaml.safe_load(GLOBAL_CONFIG_PATH.read_text()) or {}
-            return json.loads(GLOBAL_CONFIG_PATH.read_text())
-        except (OSError, json.JSONDecodeError, yaml.YAMLError) as exc:
-            logger.warning(
-                "Failed to load global config from %s", GLOBAL_CONFIG_PATH, exc_info=exc
-            )
-            return {}
-    return {}
+            return yaml.load(data, Loader=loader) or {}
+        except yaml.YAMLError as exc:
+            return _config_load_failed(exc)
+    try:
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data)
+    except ValueError as exc:
+        return _config_load_failed(exc)
 
 
 def save_global_config(cfg: dict[str, str]) -> None:
     GLOBAL_CONFIG_DIR.mkdir(parents=True, exist_ok=True, mode=0o700)
-    if GLOBAL_CONFIG_PATH.suffix in {".yaml", ".yml"}:
-        GLOBAL_CONFIG_PATH.write_text(yaml.safe_dump(cfg))
+    if GLOBAL_CONFIG_PATH.suffix in _YAML_SUFFIXES:
+        import yaml
+
+        dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+        data = yaml.dump(cfg, Dumper=dumper).encode()
+    elif orjson is not None:
+        data = orjson.dumps(cfg, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
     else:
-        GLOBAL_CONFIG_PATH.write_text(json.dumps(cfg, indent=2))
+        data = json.dumps(cfg, indent=2, sort_keys=True).encode()
+    # Write to a private sibling file and swap it in so a crash never leaves a
+    # truncated config behind.
+    tmp = GLOBAL_CONFIG_PATH.with_name(f".{GLOBAL_CONFIG_PATH.name}.{os.getpid()}.tmp")
+    try:
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with open(fd, "wb") as fh:
+            fh.write(data)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp, GLOBAL_CONFIG_PATH)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
     if os.name != "nt":
         GLOBAL_CONFIG_PATH.chmod(0o600)
+    _invalidate_config_cache()
+
+
+# Parsed global config and ``.env`` values keyed on the files' stat results so
+# repeated ``read_configs`` calls within one process skip redundant parsing.
+_CONFIG_CACHE: tuple[tuple[object, ...], dict[str, str], dict[str, str]] | None = None
+
+
+def _stat_key(path: str | Path) -> tuple[int, int] | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+# Parsed ``.env`` files keyed on absolute path and stat result.
+_DOTENV_CACHE: dict[str, tuple[tuple[int, int], dict[str, str]]] = {}
+
+
+def _cached_dotenv_values(path: str | Path) -> dict[str, str]:
+    """Return the non-empty values from *path*, reusing a prior parse.
+
+    The file is only re-read when its modification time or size changes.
+    Missing files yield an empty mapping.
+    """
+    abspath = os.path.abspath(path)
+    stat_key = _stat_key(abspath)
+    if stat_key is None:
+        _DOTENV_CACHE.pop(abspath, None)
+        return {}
+    cached = _DOTENV_CACHE.get(abspath)
+    if cached is not None and cached[0] == stat_key:
+        return dict(cached[1])
+    values = {k: v for k, v in dotenv_values(abspath).items() if v is not None}
+    _DOTENV_CACHE[abspath] = (stat_key, values)
+    return dict(values)
+
+
+def _invalidate_config_cache() -> None:
+    """Force the next :func:`read_configs` call to re-read config files."""
+    global _CONFIG_CACHE
+    _CONFIG_CACHE = None
+    _DOTENV_CACHE.clear()
 
 
 def read_configs() -> tuple[dict[str, str], dict[str, str], dict[str, str]]:
-    global_cfg = load_global_config()
-    env_vals: dict[str, str] = {}
-    if Path(ENV_FILE).exists():
-        raw_env = dotenv_values(ENV_FILE)
-        env_vals = {k: v for k, v in raw_env.items() if v is not None}
+    global _CONFIG_CACHE
+    key = (
+        str(GLOBAL_CONFIG_PATH),
+        _stat_key(GLOBAL_CONFIG_PATH),
+        os.path.abspath(ENV_FILE),
+        _stat_key(ENV_FILE),
+    )
+    if _CONFIG_CACHE is not None and _CONFIG_CACHE[0] == key:
+        _, global_cfg, env_vals = _CONFIG_CACHE
+    else:
+        global_cfg = load_global_config()
+        env_vals = _cached_dotenv_values(ENV_FILE)
+        _CONFIG_CACHE = (key, global_cfg, env_vals)
     merged = {**global_cfg, **env_vals, **os.environ}
-    return global_cfg, env_vals, merged
+    return dict(global_cfg), dict(env_vals), merged
 
 
 def _parse_embed_dimensions(val: str | None) -> int:
@@ -134,22 +316,46 @@ def _parse_embed_dimensions(val: str | None) -> int:
 
 logger = logging.getLogger(__name__)
 
-# File extensions considered raw inputs for the pipeline.
-RAW_SUFFIXES = {
-    ".pdf",
-    ".docx",
-    ".pptx",
-    ".png",
-    ".jpg",
-    ".jpeg",
-    ".gif",
-    ".tif",
-    ".tiff",
-    ".bmp",
-    ".webp",
-    ".svg",
+# Configuration values treated as enabled for boolean settings.
+_TRUTHY: frozenset[str] = frozenset({"1", "true", "yes", "on"})
+
+
+def _is_truthy(value: str | None) -> bool:
+    """Return ``True`` if *value* is a recognised truthy configuration string."""
+    return value is not None and value.strip().lower() in _TRUTHY
+
+
+# Log level names accepted by ``--log-level`` and ``LOG_LEVEL``, including the
+# ``WARN``/``FATAL`` aliases understood by :mod:`logging`.
+_LEVELS: dict[str, int] = {
+    "CRITICAL": logging.CRITICAL,
+    "FATAL": logging.FATAL,
+    "ERROR": logging.ERROR,
+    "WARNING": logging.WARNING,
+    "WARN": logging.WARN,
+    "INFO": logging.INFO,
+    "DEBUG": logging.DEBUG,
+    "NOTSET": logging.NOTSET,
 }
 
+# File extensions considered raw inputs for the pipeline.
+RAW_SUFFIXES: frozenset[str] = frozenset(
+    {
+        ".pdf",
+        ".docx",
+        ".pptx",
+        ".png",
+        ".jpg",
+        ".jpeg",
+        ".gif",
+        ".tif",
+        ".tiff",
+        ".bmp",
+        ".webp",
+        ".svg",
+    }
+)
+
 
 class ModelName(str, Enum):
     """Supported model names for CLI options."""
@@ -218,13 +424,9 @@ def _main_callback(
         console.no_color = True
     ctx.obj["no_color"] = no_color
 
-    verbose_default = merged.get("VERBOSE", "").lower() in {"1", "true", "yes"}
-    banner_default = merged.get("DOC_AI_BANNER", "").lower() in {"1", "true", "yes"}
-    interactive_default = merged.get("interactive", "true").lower() in {
-        "1",
-        "true",
-        "yes",
-    }
+    verbose_default = _is_truthy(merged.get("VERBOSE"))
+    banner_default = _is_truthy(merged.get("DOC_AI_BANNER"))
+    interactive_default = _is_truthy(merged.get("interactive", "true"))
 
     effective_verbose = verbose if verbose is not None else verbose_default
     level_name = log_level if log_level is not None else merged.get("LOG_LEVEL")
@@ -233,15 +435,15 @@ def _main_callback(
     if level_name is None:
         level_name = "DEBUG" if verbose_default else "WARNING"
     if isinstance(level_name, str):
-        numeric_level = logging.getLevelName(level_name.upper())
-        if isinstance(numeric_level, str):
+        upper_name = level_name.upper()
+        if upper_name not in _LEVELS:
             allowed = ", ".join(
                 ["CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG", "NOTSET"]
             )
             raise typer.BadParameter(
                 f"Invalid log level '{level_name}'. Allowed levels: {allowed}"
             )
-        level_name = level_name.upper()
+        level_name = upper_name
     log_file_val = log_file if log_file is not None else merged.get("LOG_FILE")
     log_file_path = (
         Path(log_file_val)
@@ -272,8 +474,15 @@ ASCII_ART = r"""
 """
 
 
+# Pre-rendered banner so printing it skips Rich's markup parser.
+_BANNER_ANSI = f"\x1b[1;32m{ASCII_ART}\x1b[0m\n"
+_BANNER_PLAIN = f"{ASCII_ART}\n"
+
+
 def _print_banner() -> None:  # pragma: no cover - visual flair only
-    console.print(f"[bold green]{ASCII_ART}[/bold green]")
+    colour = console.is_terminal and not console.no_color
+    sys.stdout.write(_BANNER_ANSI if colour else _BANNER_PLAIN)
+    sys.stdout.flush()
 
 
 @app.command("exit")
@@ -298,8 +507,9 @@ def cd(ctx: typer.Context, path: Path | None = typer.Argument(None)) -> None:
 
     # Recompute .env location and refresh environment variables
     global ENV_FILE
-    ENV_FILE = find_dotenv(usecwd=True, raise_error_if_not_found=False) or ".env"
+    ENV_FILE = _find_env_file()
     load_dotenv(ENV_FILE, override=True)
+    _invalidate_config_cache()
 
     # Reload configuration so subsequent commands see updated values
     global_cfg, _env_vals, merged = read_configs()
@@ -318,12 +528,9 @@ def cd(ctx: typer.Context, path: Path | None = typer.Argument(None)) -> None:
             comp.refresh()
 
     # Ensure config submodule uses the new ENV_FILE if already imported
-    try:  # pragma: no cover - defensive
-        from . import config as config_module
-
+    config_module = sys.modules.get(f"{__name__}.config")
+    if config_module is not None:
         setattr(config_module, "ENV_FILE", ENV_FILE)
-    except Exception:  # pragma: no cover - defensive
-        logger.exception("Failed to update ENV_FILE in config module")
 
 
 @app.command("version")
@@ -352,30 +559,15 @@ def run_prompt(*args: Any, **kwargs: Any) -> Any:
     return _run_prompt(*args, **kwargs)
 
 
-# Register subcommands implemented in dedicated modules.
-from . import add as add_cmd  # noqa: E402
-from . import analyze as analyze_cmd  # noqa: E402
-from . import config as config_cmd  # noqa: E402
-from . import convert as convert_cmd  # noqa: E402
-from . import embed as embed_cmd  # noqa: E402
-from . import manage_urls as manage_urls_cmd  # noqa: E402
-
+# Register subcommands implemented in dedicated modules. Most are loaded lazily
+# via ``_LAZY_SUBCOMMANDS``; ``pipeline`` is re-exported below so it is always
+# imported.
 pipeline_cmd = importlib.import_module("doc_ai.cli.pipeline")  # noqa: E402
-from . import init_workflows as init_workflows_cmd  # noqa: E402
 from . import new_doc_type as new_doc_type_cmd  # noqa: E402
 from . import new_topic as new_topic_cmd  # noqa: E402
 from . import prompt as prompt_cmd  # noqa: E402
-from . import query as query_cmd  # noqa: E402
-from . import validate as validate_cmd  # noqa: E402
-
-app.add_typer(config_cmd.app, name="config")  # type: ignore[has-type]
-app.add_typer(convert_cmd.app, name="convert")
-app.add_typer(validate_cmd.app, name="validate")  # type: ignore[has-type]
-app.add_typer(analyze_cmd.app, name="analyze")  # type: ignore[has-type]
-app.add_typer(embed_cmd.app, name="embed")  # type: ignore[has-type]
+
 app.add_typer(pipeline_cmd.app, name="pipeline")
-app.add_typer(query_cmd.app, name="query")  # type: ignore[has-type]
-app.add_typer(init_workflows_cmd.app, name="init-workflows")
 
 new_app = typer.Typer(help="Scaffold new document types and topic prompts")
 new_app.command("doc-type")(new_doc_type_cmd.doc_type)
@@ -390,10 +582,6 @@ new_app.command("delete-topic")(new_topic_cmd.delete_topic)
 new_app.command("duplicate-topic")(new_topic_cmd.duplicate_topic)
 app.add_typer(new_app, name="new")
 
-app.add_typer(add_cmd.app, name="add")
-app.add_typer(manage_urls_cmd.app, name="urls")
-app.command("set")(config_cmd.set_defaults)
-
 # Prompt inspection and editing
 show_app = typer.Typer(help="Display resources")
 edit_app = typer.Typer(help="Modify resources")
@@ -438,17 +626,74 @@ app.add_typer(edit_app, name="edit")
 
 
 _LOADED_PLUGINS: dict[str, typer.Typer] = {}
+_PLUGINS_REGISTERED = False
+_PLUGIN_ENTRY_POINTS: dict[str, Any] | None = None
+
+
+def _plugin_entry_points() -> dict[str, Any]:
+    """Return ``doc_ai.plugins`` entry points by name, discovered once per process."""
+    global _PLUGIN_ENTRY_POINTS
+    if _PLUGIN_ENTRY_POINTS is None:
+        found: dict[str, Any] = {}
+        for ep in entry_points(group="doc_ai.plugins"):
+            found.setdefault(ep.name, ep)
+        _PLUGIN_ENTRY_POINTS = found
+    return _PLUGIN_ENTRY_POINTS
+
+
+def _ensure_plugins_registered() -> None:
+    """Run :func:`_register_plugins` the first time plugins are needed."""
+    global _PLUGINS_REGISTERED
+    if not _PLUGINS_REGISTERED:
+        _PLUGINS_REGISTERED = True
+        _register_plugins()
+
+
+def _walk_files(top: str) -> Iterator[str]:
+    """Yield regular files below *top* without following directory symlinks."""
+    with os.scandir(top) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_files(entry.path)
+            elif entry.is_file():
+                yield entry.path
+
+
+def _distribution_files(root: Path) -> list[str]:
+    """Return the files under *root* that contribute to its digest.
+
+    Paths are ordered component-wise, matching how :class:`Path` objects sort.
+    """
+    return sorted(_walk_files(str(root)), key=lambda p: p.split(os.sep))
+
 
+def _update_digest_from_file(digest: Any, fh: BinaryIO) -> None:
+    """Feed the contents of *fh* into *digest*.
 
-def _hash_distribution(dist: object) -> str:
-    """Return a SHA256 digest of a distribution's files."""
+    Uses :func:`hashlib.file_digest` on Python 3.11+ so the read loop runs in
+    C, falling back to 1 MiB chunks on older interpreters.
+    """
+    file_digest = getattr(hashlib, "file_digest", None)
+    if file_digest is not None:
+        file_digest(fh, lambda: digest)
+        return
+    for chunk in iter(lambda: fh.read(1024 * 1024), b""):
+        digest.update(chunk)
+
+
+def _hash_distribution(dist: object) -> bytes:
+    """Return the raw SHA256 digest of a distribution's files.
+
+    The digest is recomputed from file contents on every call; it gates
+    whether plugin code is trusted, so no persisted value is reused.
+    """
     root = Path(getattr(dist, "locate_file", lambda x: "")("") or "")
     digest = hashlib.sha256()
     if root and root.exists():
-        for path in sorted(root.rglob("*")):
-            if path.is_file():
-                digest.update(path.read_bytes())
-    return digest.hexdigest()
+        for path in _distribution_files(root):
+            with open(path, "rb") as fh:
+                _update_digest_from_file(digest, fh)
+    return digest.digest()
 
 
 def _register_plugins() -> None:
@@ -467,16 +712,25 @@ def _register_plugins() -> None:
             allowed[item] = None
 
     hashes_raw = merged.get("DOC_AI_TRUSTED_PLUGIN_HASHES", "")
-    expected_hashes: dict[str, str] = {}
+    expected_hashes: dict[str, bytes] = {}
     for item in hashes_raw.split(","):
         item = item.strip()
         if not item or "=" not in item:
             continue
         name, digest = item.split("=", 1)
-        expected_hashes[name.strip()] = digest.strip()
-
-    for ep in entry_points(group="doc_ai.plugins"):
-        if ep.name in _LOADED_PLUGINS:
+        try:
+            expected_hashes[name.strip()] = bytes.fromhex(digest.strip())
+        except ValueError:
+            logger.error("Ignoring malformed trusted hash for plugin %s", name)
+
+    # Only trusted names are looked up, so untrusted plugins are never hashed.
+    available = _plugin_entry_points()
+    for plugin_name, expected_version in allowed.items():
+        if plugin_name in _LOADED_PLUGINS:
+            continue
+        ep = available.get(plugin_name)
+        if ep is None:
+            logger.info("Trusted plugin %s is not installed", plugin_name)
             continue
 
         dist = getattr(ep, "dist", None)
@@ -484,10 +738,6 @@ def _register_plugins() -> None:
         version = getattr(dist, "version", "unknown")
         logger.info("Discovered plugin %s from %s %s", ep.name, pkg_name, version)
 
-        if ep.name not in allowed:
-            logger.info("Skipping untrusted plugin %s", ep.name)
-            continue
-        expected_version = allowed[ep.name]
         if not expected_version:
             logger.error("Skipping plugin %s: trusted version not specified", ep.name)
             continue
@@ -550,6 +800,7 @@ plugins_app = typer.Typer(help="Utilities for inspecting plugins.")
 @plugins_app.command("list")
 def list_plugins() -> None:
     """Print the names of loaded plugins."""
+    _ensure_plugins_registered()
     if not _LOADED_PLUGINS:
         typer.echo("No plugins loaded.")
         raise typer.Exit()
@@ -614,9 +865,6 @@ def untrust_plugin(name: str) -> None:
 
 app.add_typer(plugins_app, name="plugins")
 
-
-_register_plugins()
-
 # Re-export pipeline callback for tests and external use.
 from .pipeline import pipeline  # noqa: E402
 
@@ -635,39 +883,86 @@ __all__ = [
 ]
 
 
+_LAZY_MODULES = {
+    "add",
+    "analyze",
+    "config",
+    "convert",
+    "embed",
+    "init_workflows",
+    "manage_urls",
+    "query",
+    "validate",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import lazily registered subcommand modules on attribute access."""
+    if name == "convert_path":
+        from doc_ai.converter import convert_path
+
+        globals()[name] = convert_path
+        return convert_path
+    module = name.removesuffix("_cmd")
+    if module in _LAZY_MODULES:
+        return importlib.import_module(f"{__name__}.{module}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Options consumed by :func:`main` before the remaining arguments reach Typer.
+_INIT_FLAGS = frozenset({"--init", "--batch"})
+_MAIN_PATH_FLAGS = _INIT_FLAGS | {"--run"}
+
+
+def _extract_path_flags(args: list[str]) -> tuple[list[str], dict[str, Path]]:
+    """Split ``--run``/``--init``/``--batch`` options from *args* in one pass.
+
+    Both ``--flag PATH`` and ``--flag=PATH`` forms are accepted. Only the
+    first occurrence of each flag is consumed. ``--init`` and ``--batch`` are
+    aliases, so passing both is an error.
+
+    Returns:
+        The remaining arguments and a mapping of flag to path.
+    """
+    remaining: list[str] = []
+    found: dict[str, Path] = {}
+    i = 0
+    count = len(args)
+    while i < count:
+        arg = args[i]
+        flag, sep, value = arg.partition("=")
+        if flag in _MAIN_PATH_FLAGS and flag not in found:
+            if not sep:
+                if i + 1 >= count:
+                    logger.error("[red]%s requires a path[/red]", flag)
+                    raise SystemExit(1)
+                i += 1
+                value = args[i]
+            if flag in _INIT_FLAGS and _INIT_FLAGS & found.keys():
+                logger.error("[red]--init and --batch cannot be used together[/red]")
+                raise SystemExit(1)
+            found[flag] = Path(value)
+        else:
+            remaining.append(arg)
+        i += 1
+    return remaining, found
+
+
+def _startup_state() -> tuple[bool, bool]:
+    """Return the ``(banner, interactive)`` settings for a bare ``main()`` call."""
+    _, _, merged = read_configs()
+    return (
+        _is_truthy(merged.get("DOC_AI_BANNER")),
+        _is_truthy(merged.get("interactive", "true")),
+    )
+
+
 def main() -> None:
     """Entry point for running the CLI as a script."""
     load_dotenv(ENV_FILE)
-    args = sys.argv[1:]
-    run_path: Path | None = None
-    for i, arg in enumerate(list(args)):
-        if arg == "--run":
-            if i + 1 >= len(args):
-                logger.error("[red]--run requires a path[/red]")
-                raise SystemExit(1)
-            run_path = Path(args[i + 1])
-            del args[i : i + 2]
-            break
-        if arg.startswith("--run="):
-            run_path = Path(arg.split("=", 1)[1])
-            del args[i]
-            break
-    init_path: Path | None = None
-    for flag in ("--init", "--batch"):
-        for i, arg in enumerate(list(args)):
-            if arg == flag:
-                if i + 1 >= len(args):
-                    logger.error("[red]%s requires a path[/red]", flag)
-                    raise SystemExit(1)
-                init_path = Path(args[i + 1])
-                del args[i : i + 2]
-                break
-            if arg.startswith(f"{flag}="):
-                init_path = Path(arg.split("=", 1)[1])
-                del args[i]
-                break
-        if init_path is not None:
-            break
+    args, path_flags = _extract_path_flags(sys.argv[1:])
+    run_path = path_flags.get("--run")
+    init_path = path_flags.get("--init") or path_flags.get("--batch")
     for path in (run_path, init_path):
         if path is not None and not path.exists():
             logger.error("[red]Batch file not found: %s[/red]", path)
@@ -691,23 +986,16 @@ def main() -> None:
     if not sys.stdin.isatty() or not sys.stdout.isatty():
         app(prog_name="cli.py", args=["--help"])
         return
-    _, _, merged = read_configs()
-    banner_cfg = merged.get("DOC_AI_BANNER", "").lower() in {"1", "true", "yes"}
-    interactive_cfg = merged.get("interactive", "true").lower() in {"1", "true", "yes"}
-    if not interactive_cfg:
+    banner_cfg, interactive_cfg = _startup_state()
+    if banner_cfg or not interactive_cfg:
         if banner_cfg:
             _print_banner()
         try:
             app(prog_name="cli.py", args=["--help"])
         except SystemExit:
             pass
+    if not interactive_cfg:
         return
-    if banner_cfg:
-        _print_banner()
-        try:
-            app(prog_name="cli.py", args=["--help"])
-        except SystemExit:
-            pass
     logger.info("Starting interactive Doc AI shell. Type 'exit' or 'quit' to leave.")
     interactive_shell(app, init=init_path)
     logger.info("Goodbye!")
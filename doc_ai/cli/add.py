@@ -71,29 +71,30 @@ def add_urls(
     """Download URLs from *path* and convert them."""
 
     cfg = ctx.obj.get("config", {}) if ctx.obj else {}
-    path_val = prompt_if_missing(
-        ctx, str(path) if path is not None else None, "File containing URLs"
-    )
-    if path_val is None:
-        raise typer.BadParameter("File containing URLs required")
-    path = Path(path_val)
+    if path is None:
+        path_val = prompt_if_missing(ctx, None, "File containing URLs")
+        if path_val is None:
+            raise typer.BadParameter("File containing URLs required")
+        path = Path(path_val)
     doc_type = select_doc_type(ctx, doc_type)
     fmts = format or _parse_config_formats(cfg) or [OutputFormat.MARKDOWN]
     force = resolve_bool(ctx, "force", force, cfg, "FORCE")
+    with path.open("r", encoding="utf-8") as fh:
+        urls = [url for url in (line.strip() for line in fh) if url]
     links: list[str] = []
     seen: set[str] = set()
-    for line in path.read_text().splitlines():
-        url = line.strip()
-        if not url:
-            continue
+    skipped: list[str] = []
+    for url in urls:
         if not _valid_url(url):
-            typer.echo(f"Skipping invalid URL: {url}")
-            continue
-        if url in seen:
-            typer.echo(f"Skipping duplicate URL: {url}")
-            continue
-        seen.add(url)
-        links.append(url)
+            skipped.append(f"Skipping invalid URL: {url}")
+        elif url in seen:
+            skipped.append(f"Skipping duplicate URL: {url}")
+        else:
+            seen.add(url)
+            links.append(url)
+    if skipped:
+        # Emit all skip notices in a single write rather than one per URL.
+        typer.echo("\n".join(skipped))
     if not links:
         typer.echo("No valid URLs found in file.")
         return
@@ -10,14 +10,12 @@ from doc_ai.converter import OutputFormat
 
 from . import ModelName, _validate_prompt
 from .utils import (
+    SUFFIXES,
     analyze_doc,
     prompt_if_missing,
     resolve_bool,
     resolve_str,
 )
-from .utils import (
-    suffix as _suffix,
-)
 
 logger = logging.getLogger(__name__)
 
@@ -106,9 +104,10 @@ def analyze(
     estimate = resolve_bool(ctx, "estimate", estimate, cfg, "ESTIMATE")
     force = resolve_bool(ctx, "force", force, cfg, "FORCE")
     markdown_doc = source
-    if ".converted" not in "".join(markdown_doc.suffixes):
+    name = markdown_doc.name
+    if ".converted." not in name and not name.endswith(".converted"):
         used_fmt = fmt or OutputFormat.MARKDOWN
-        markdown_doc = source.with_name(source.name + _suffix(used_fmt))
+        markdown_doc = source.with_name(source.name + SUFFIXES[used_fmt])
     try:
         topics_list: list[str | None] = list(topic) if topic else []
         if not topics_list:
@@ -117,19 +116,18 @@ def analyze(
                 topics_list = [default_topic]
         if not topics_list:
             topics_list = [None]
-        for tp in topics_list:
-            analyze_doc(
-                markdown_doc,
-                prompt,
-                output,
-                model,
-                base_model_url,
-                require_json,
-                show_cost,
-                estimate,
-                topic=tp,
-                force=force,
-            )
+        analyze_doc(
+            markdown_doc,
+            prompt,
+            output,
+            model,
+            base_model_url,
+            require_json,
+            show_cost,
+            estimate,
+            topics=topics_list,
+            force=force,
+        )
     except Exception as exc:
         logger.exception("Analysis failed for %s", markdown_doc)
         logger.error("[red]%s[/red]", exc)
@@ -1,70 +1,83 @@
 from __future__ import annotations
 
+import io
 import logging
 import os
 import sys
+from itertools import zip_longest
 from pathlib import Path
 
 import questionary
 import typer
-from dotenv import dotenv_values, set_key
-from rich.panel import Panel
-from rich.table import Table
-
-from . import ENV_FILE, console, read_configs, save_global_config
+from dotenv.parser import parse_stream
+
+from . import (
+    ENV_FILE,
+    _cached_dotenv_values,
+    _invalidate_config_cache,
+    console,
+    read_configs,
+    save_global_config,
+)
 from .interactive import SAFE_ENV_VARS_ENV, _parse_allow_deny, refresh_completer
 from .utils import get_logging_options, load_env_defaults, prompt_if_missing
 
-TRUE_SET = {"1", "true", "yes"}
-FALSE_SET = {"0", "false", "no"}
+TRUE_SET = frozenset({"1", "true", "yes"})
+FALSE_SET = frozenset({"0", "false", "no"})
+_BOOL_VALUES = TRUE_SET | FALSE_SET
+_BOOL_MAP = {**dict.fromkeys(TRUE_SET, True), **dict.fromkeys(FALSE_SET, False)}
 
 # Known configuration keys and booleans for validation
 _defaults = load_env_defaults()
-BOOLEAN_KEYS = {
-    "FAIL_FAST",
-    "VERBOSE",
-    "INTERACTIVE",
-    "ASK",
-    "FORCE",
-    "SHOW_COST",
-    "ESTIMATE",
-    "REQUIRE_STRUCTURED",
-    "DRY_RUN",
-    "YES",
-    "DOC_AI_BANNER",
-    "DOC_AI_ALLOW_SHELL",
-} | {
-    k
-    for k, v in _defaults.items()
-    if isinstance(v, str) and v.lower() in TRUE_SET | FALSE_SET
-}
-
-KNOWN_KEYS = set(_defaults) | {
-    "MODEL",
-    "BASE_MODEL_URL",
-    "REQUIRE_STRUCTURED",
-    "SHOW_COST",
-    "ESTIMATE",
-    "FORCE",
-    "FAIL_FAST",
-    "OUTPUT_FORMATS",
-    "WORKERS",
-    "DEST",
-    "OVERWRITE",
-    "DRY_RUN",
-    "YES",
-    "RESUME_FROM",
-    "ASK",
-    "VALIDATE_MODEL",
-    "VALIDATE_BASE_MODEL_URL",
-    "LOG_LEVEL",
-    "LOG_FILE",
-    "VERBOSE",
-    "DOC_AI_BANNER",
-    "DOC_AI_ALLOW_SHELL",
-    "DOC_AI_HISTORY_FILE",
-    "INTERACTIVE",
-}
+BOOLEAN_KEYS = frozenset(
+    {
+        "FAIL_FAST",
+        "VERBOSE",
+        "INTERACTIVE",
+        "ASK",
+        "FORCE",
+        "SHOW_COST",
+        "ESTIMATE",
+        "REQUIRE_STRUCTURED",
+        "DRY_RUN",
+        "YES",
+        "DOC_AI_BANNER",
+        "DOC_AI_ALLOW_SHELL",
+    }.union(
+        k
+        for k, v in _defaults.items()
+        if isinstance(v, str) and v.lower() in _BOOL_VALUES
+    )
+)
+
+KNOWN_KEYS = frozenset(_defaults).union(
+    {
+        "MODEL",
+        "BASE_MODEL_URL",
+        "REQUIRE_STRUCTURED",
+        "SHOW_COST",
+        "ESTIMATE",
+        "FORCE",
+        "FAIL_FAST",
+        "OUTPUT_FORMATS",
+        "WORKERS",
+        "DEST",
+        "OVERWRITE",
+        "DRY_RUN",
+        "YES",
+        "RESUME_FROM",
+        "ASK",
+        "VALIDATE_MODEL",
+        "VALIDATE_BASE_MODEL_URL",
+        "LOG_LEVEL",
+        "LOG_FILE",
+        "VERBOSE",
+        "DOC_AI_BANNER",
+        "DOC_AI_ALLOW_SHELL",
+        "DOC_AI_HISTORY_FILE",
+        "INTERACTIVE",
+    }
+)
 
 logger = logging.getLogger(__name__)
 
@@ -81,40 +94,50 @@ safe_env_app = typer.Typer(
 app.add_typer(safe_env_app, name="safe-env")
 
 
-def _read_safe_env(ctx: typer.Context) -> tuple[set[str], set[str]]:
+def _safe_env_raw(ctx: typer.Context) -> str | None:
     cfg = ctx.obj.get("global_config", {}) if ctx.obj else {}
     if SAFE_ENV_VARS_ENV in cfg:
-        raw: str | None = str(cfg[SAFE_ENV_VARS_ENV])
-    elif SAFE_ENV_VARS_ENV in os.environ:
-        raw = os.environ[SAFE_ENV_VARS_ENV]
-    else:
-        raw = None
-    return _parse_allow_deny(raw)
+        return str(cfg[SAFE_ENV_VARS_ENV])
+    return os.environ.get(SAFE_ENV_VARS_ENV)
+
+
+def _read_safe_env(ctx: typer.Context) -> tuple[set[str], set[str]]:
+    return _parse_allow_deny(_safe_env_raw(ctx))
 
 
 def _write_safe_env(ctx: typer.Context, allow: set[str], deny: set[str]) -> None:
     cfg = dict(ctx.obj.get("global_config", {}))
-    parts = list(sorted(allow)) + [f"-{d}" for d in sorted(deny)]
+    allow_list = tuple(sorted(allow))
+    deny_list = tuple(sorted(deny))
+    parts = [*allow_list, *(f"-{d}" for d in deny_list)]
     if parts:
-        cfg[SAFE_ENV_VARS_ENV] = ",".join(parts)
+        raw: str | None = ",".join(parts)
+        cfg[SAFE_ENV_VARS_ENV] = raw
     else:
+        raw = None
         cfg.pop(SAFE_ENV_VARS_ENV, None)
     save_global_config(cfg)
     ctx.obj["global_config"] = cfg
+    # Remember the sorted lists alongside the raw value they were built from so
+    # ``safe-env list`` can reuse them while the setting is unchanged.
+    ctx.obj["_safe_env_sorted"] = (raw, allow_list, deny_list)
     refresh_completer()
 
 
 @safe_env_app.command("list")
 def list_safe_env(ctx: typer.Context) -> None:
     """Show allowed and denied environment variable names."""
-    allow, deny = _read_safe_env(ctx)
+    from rich.table import Table
+
+    raw = _safe_env_raw(ctx)
+    cached = ctx.obj.get("_safe_env_sorted") if ctx.obj else None
+    if cached is not None and cached[0] == raw:
+        _, allow_list, deny_list = cached
+    else:
+        allow, deny = _parse_allow_deny(raw)
+        allow_list, deny_list = tuple(sorted(allow)), tuple(sorted(deny))
     table = Table("Allowed", "Denied")
-    rows = max(len(allow), len(deny))
-    allow_list = sorted(allow)
-    deny_list = sorted(deny)
-    for i in range(rows):
-        a = allow_list[i] if i < len(allow_list) else ""
-        d = deny_list[i] if i < len(deny_list) else ""
+    for a, d in zip_longest(allow_list, deny_list, fillvalue=""):
         table.add_row(a, d)
     console.print(table)
 
@@ -131,10 +154,9 @@ def add_safe_env(
         if name is None:
             raise typer.BadParameter("NAME required")
         items = [name]
-    for raw in items:
-        a, d = _parse_allow_deny(raw)
-        allow |= a
-        deny |= d
+    a, d = _parse_allow_deny(",".join(items))
+    allow |= a
+    deny |= d
     _write_safe_env(ctx, allow, deny)
 
 
@@ -157,61 +179,102 @@ def remove_safe_env(
 
 
 def _parse_value(value: str) -> bool | str:
-    low = value.lower()
-    if low in TRUE_SET:
-        return True
-    if low in FALSE_SET:
-        return False
-    return value
+    return _BOOL_MAP.get(value.lower(), value)
+
+
+_BOOL_STR = {True: "true", False: "false"}
+
+
+def _env_string(value: bool | str) -> str:
+    """Return the ``.env``/environment spelling of a parsed config value."""
+    if isinstance(value, bool):
+        return _BOOL_STR[value]
+    return str(value)
+
+
+def _write_env_file(env_path: Path, updates: dict[str, str]) -> None:
+    """Apply ``updates`` to ``env_path`` in a single atomic rewrite.
+
+    Assignments are located with python-dotenv's own parser, as
+    :func:`dotenv.set_key` does, so every binding of an updated key is
+    replaced and multi-line quoted values are left intact. Comments and
+    ordering are preserved; new keys are appended. The file is always left
+    with ``0600`` permissions.
+    """
+    try:
+        source = env_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        source = ""
+    out: list[str] = []
+    written: set[str] = set()
+    for binding in parse_stream(io.StringIO(source)):
+        key = binding.key
+        if key is not None and key in updates:
+            out.append(f"{key}={updates[key]}\n")
+            written.add(key)
+        else:
+            out.append(binding.original.string)
+    missing = [
+        f"{key}={value}\n" for key, value in updates.items() if key not in written
+    ]
+    if missing and out and not out[-1].endswith("\n"):
+        out.append("\n")
+    out.extend(missing)
+    data = "".join(out).encode("utf-8")
+    tmp = env_path.with_name(f".{env_path.name}.{os.getpid()}.tmp")
+    try:
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with open(fd, "wb") as fh:
+            fh.write(data)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp, env_path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    env_path.chmod(0o600)
+
+
+def _reload_ctx_config(ctx: typer.Context) -> None:
+    """Refresh ``ctx.obj`` from the (cached) config sources after a write."""
+    global_cfg, _env_vals, merged = read_configs()
+    ctx.obj.update({"global_config": global_cfg, "config": merged})
+    refresh_completer()
+
+
+def _unknown_key_message(key: str) -> str:
+    import difflib
+
+    message = f"Unknown config key '{key}'"
+    matches = difflib.get_close_matches(key, sorted(KNOWN_KEYS), n=1)
+    if matches:
+        message += f" (did you mean '{matches[0]}'?)"
+    return message
 
 
 def _set_pairs(ctx: typer.Context, pairs: list[str], use_global: bool) -> None:
     """Persist ``VAR=VALUE`` pairs to config sources."""
-    force_global = use_global or any(p.split("=", 1)[0] == "interactive" for p in pairs)
+    split_pairs = [item.split("=", 1) for item in pairs]
+    if any(len(pair) != 2 for pair in split_pairs):
+        raise typer.BadParameter("Use VAR=VALUE syntax")
+    force_global = use_global or any(key == "interactive" for key, _ in split_pairs)
+    parsed_pairs: dict[str, bool | str] = {}
+    for key, value in split_pairs:
+        key = key.strip().upper()
+        if key not in KNOWN_KEYS:
+            raise typer.BadParameter(_unknown_key_message(key))
+        parsed_pairs[key] = _parse_value(value)
+    env_values = {key: _env_string(value) for key, value in parsed_pairs.items()}
+    os.environ.update(env_values)
     if force_global:
         cfg = dict(ctx.obj.get("global_config", {}))
-        for item in pairs:
-            try:
-                key, value = item.split("=", 1)
-            except ValueError as exc:  # pragma: no cover - handled by typer
-                raise typer.BadParameter("Use VAR=VALUE syntax") from exc
-            key = key.strip().upper()
-            if key not in KNOWN_KEYS:
-                raise typer.BadParameter(f"Unknown config key '{key}'")
-            parsed = _parse_value(value)
-            env_val = (
-                "true"
-                if parsed is True
-                else "false" if parsed is False else str(parsed)
-            )
-            os.environ[key] = env_val
-            cfg[key] = parsed
+        cfg.update(parsed_pairs)
         save_global_config(cfg)
         ctx.obj["global_config"] = cfg
     else:
-        env_path = Path(ENV_FILE)
-        env_path.touch(exist_ok=True)
-        env_path.chmod(0o600)
-        for item in pairs:
-            try:
-                key, value = item.split("=", 1)
-            except ValueError as exc:  # pragma: no cover - handled by typer
-                raise typer.BadParameter("Use VAR=VALUE syntax") from exc
-            key = key.strip().upper()
-            if key not in KNOWN_KEYS:
-                raise typer.BadParameter(f"Unknown config key '{key}'")
-            parsed = _parse_value(value)
-            env_val = (
-                "true"
-                if parsed is True
-                else "false" if parsed is False else str(parsed)
-            )
-            os.environ[key] = env_val
-            set_key(str(env_path), key, env_val, quote_mode="never")
-            env_path.chmod(0o600)
-    global_cfg, _env_vals, merged = read_configs()
-    ctx.obj.update({"global_config": global_cfg, "config": merged})
-    refresh_completer()
+        _write_env_file(Path(ENV_FILE), env_values)
+        _invalidate_config_cache()
+    _reload_ctx_config(ctx)
 
 
 @app.callback()
@@ -234,7 +297,14 @@ def config(
         raise typer.Exit()
 
 
+def _cell(value: object) -> str:
+    """Return the table cell text for a setting, ``-`` when unset or empty."""
+    return str(value) if value else "-"
+
+
 def _print_settings(ctx: typer.Context) -> None:
+    from rich.table import Table
+
     logger.info("Current settings:")
     verbose, level, log_file = get_logging_options(ctx)
     logger.info("  verbose: %s", verbose)
@@ -242,26 +312,24 @@ def _print_settings(ctx: typer.Context) -> None:
         logger.info("  log_level: %s", level)
     if log_file is not None:
         logger.info("  log_file: %s", log_file)
-    defaults = load_env_defaults()
+    # Copy: the cached defaults are shared with other callers.
+    defaults = dict(load_env_defaults())
     defaults.setdefault("interactive", "true")
-    for key in os.environ:
-        if key.startswith("MODEL_PRICE_") and key not in defaults:
-            defaults[key] = None
     global_cfg = ctx.obj.get("global_config", {})
-    env_cfg = dotenv_values(ENV_FILE)
-    keys = set(defaults) | set(global_cfg) | set(env_cfg)
-    for key in os.environ:
-        if key in global_cfg or key in env_cfg or key.startswith("MODEL_PRICE_"):
-            keys.add(key)
+    env_cfg = _cached_dotenv_values(ENV_FILE)
+    # One snapshot avoids re-decoding os.environ entries for every row.
+    environ = dict(os.environ)
+    price_keys = {key for key in environ if key.startswith("MODEL_PRICE_")}
+    keys = set(defaults) | set(global_cfg) | set(env_cfg) | price_keys
     if keys:
         table = Table("Variable", "Effective", ".env", "Global", "Default")
         for var in sorted(keys):
             table.add_row(
                 var,
-                str(os.getenv(var, "") or "-"),
-                str(env_cfg.get(var, "-") or "-"),
-                str(global_cfg.get(var, "-") or "-"),
-                str(defaults.get(var, "-") or "-"),
+                _cell(environ.get(var)),
+                _cell(env_cfg.get(var)),
+                _cell(global_cfg.get(var)),
+                _cell(defaults.get(var)),
             )
         console.print(table)
 
@@ -326,9 +394,7 @@ def default_doc_type(
         cfg.pop("default_doc_type", None)
         typer.echo("Default document type cleared")
     save_global_config(cfg)
-    global_cfg, _env_vals, merged = read_configs()
-    ctx.obj.update({"global_config": global_cfg, "config": merged})
-    refresh_completer()
+    _reload_ctx_config(ctx)
 
 
 @app.command("default-topic")
@@ -345,9 +411,7 @@ def default_topic(
         cfg.pop("default_topic", None)
         typer.echo("Default topic cleared")
     save_global_config(cfg)
-    global_cfg, _env_vals, merged = read_configs()
-    ctx.obj.update({"global_config": global_cfg, "config": merged})
-    refresh_completer()
+    _reload_ctx_config(ctx)
 
 
 def set_defaults(
@@ -355,6 +419,9 @@ def set_defaults(
     pairs: list[str] | None = typer.Argument(None, metavar="VAR=VALUE"),
 ) -> None:
     """Update runtime default options for the current session."""
+    from rich.panel import Panel
+    from rich.table import Table
+
     items = list(pairs or [])
     if not items:
         pair = prompt_if_missing(ctx, None, "VAR=VALUE")
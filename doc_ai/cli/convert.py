@@ -1,20 +1,24 @@
 from __future__ import annotations
 
 import logging
+import os
+import shutil
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from threading import Lock
 from urllib.parse import urlparse
 
 import typer
 from rich.progress import Progress
 
 from doc_ai.converter import OutputFormat
-from doc_ai.utils import http_get, sanitize_filename
+from doc_ai.utils import http_get, retrying_session, sanitize_filename
 
 from .utils import (
     parse_config_formats as _parse_config_formats,
 )
+from .utils import (
+    parse_formats as _parse_formats,
+)
 from .utils import (
     prompt_if_missing,
     resolve_bool,
@@ -24,6 +28,11 @@ logger = logging.getLogger(__name__)
 
 app = typer.Typer(invoke_without_command=True, help="Convert files using Docling.")
 
+# Bytes copied per read when streaming downloads to disk.
+_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+# Upper bound on concurrent downloads; the pool never exceeds the URL count.
+_MAX_DOWNLOAD_WORKERS = 16
+
 
 def download_and_convert(
     urls: list[str],
@@ -37,30 +46,42 @@ def download_and_convert(
 
     dest = Path("data") / doc_type
     dest.mkdir(parents=True, exist_ok=True)
+    # Pick unique file names up front so workers never share state.
     seen: set[str] = set()
-    lock = Lock()
-
-    def _download(link: str) -> None:
-        resp = http_get(link, stream=True)
+    targets: list[tuple[str, Path]] = []
+    # Duplicates are common when --urls and --url overlap; fetch each once.
+    for link in dict.fromkeys(urls):
+        name = Path(urlparse(link).path).name or "downloaded"
+        sanitized = sanitize_filename(name, existing=seen)
+        seen.add(sanitized)
+        targets.append((link, dest / sanitized))
+
+    def _download(link: str, path: Path) -> None:
+        resp = http_get(link, stream=True, session=session)
+        part = path.with_name(path.name + ".part")
         try:
             resp.raise_for_status()
-            name = Path(urlparse(link).path).name or "downloaded"
-            with lock:
-                sanitized = sanitize_filename(name, existing=seen)
-                seen.add(sanitized)
-            path = dest / sanitized
-            with open(path, "wb") as fh:
-                for chunk in resp.iter_content(chunk_size=8192):
-                    if not chunk:
-                        continue
-                    fh.write(chunk)
+            # Let urllib3 undo any Content-Encoding while copying in C.
+            resp.raw.decode_content = True
+            with open(part, "wb") as fh:
+                shutil.copyfileobj(resp.raw, fh, length=_DOWNLOAD_CHUNK_SIZE)
+            os.replace(part, path)
+        except BaseException:
+            part.unlink(missing_ok=True)
+            raise
         finally:
             resp.close()
 
-    with Progress(transient=True) as progress:
-        task = progress.add_task(f"Downloading {doc_type}", total=len(urls))
-        with ThreadPoolExecutor() as executor:
-            futures = [executor.submit(_download, link) for link in urls]
+    workers = min(_MAX_DOWNLOAD_WORKERS, len(targets) or 1)
+    # One pooled session lets downloads from the same host reuse connections
+    # instead of paying a new TCP/TLS handshake per URL.
+    with (
+        Progress(transient=True) as progress,
+        retrying_session(pool_maxsize=workers) as session,
+    ):
+        task = progress.add_task(f"Downloading {doc_type}", total=len(targets))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_download, *target) for target in targets]
             for fut in as_completed(futures):
                 fut.result()
                 progress.advance(task)
@@ -90,11 +111,14 @@ def convert(
         "--doc-type",
         help="Document type for downloaded URLs",
     ),
-    format: list[OutputFormat] = typer.Option(
+    format: list[str] | None = typer.Option(
         None,
         "--format",
         "-f",
-        help="Desired output format(s). Can be passed multiple times.",
+        help=(
+            "Desired output format(s), comma-separated or passed multiple times. "
+            f"Choose from: {', '.join(fmt.value for fmt in OutputFormat)}."
+        ),
     ),
     force: bool = typer.Option(
         False,
@@ -115,12 +139,15 @@ def convert(
 
     cfg = ctx.obj.get("config", {})
     force = resolve_bool(ctx, "force", force, cfg, "FORCE")
-    fmts = format or _parse_config_formats(cfg) or [OutputFormat.MARKDOWN]
+    fmts = (
+        _parse_formats(format)
+        if format
+        else _parse_config_formats(cfg) or [OutputFormat.MARKDOWN]
+    )
     url_list: list[str] = []
     if urls is not None:
-        url_list.extend(
-            line.strip() for line in urls.read_text().splitlines() if line.strip()
-        )
+        with urls.open(encoding="utf-8") as fh:
+            url_list.extend(line for line in map(str.strip, fh) if line)
     if url:
         url_list.extend(url)
     source = prompt_if_missing(ctx, source, "Path or URL to raw document or folder")
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import functools
+import os
 import shutil
 from pathlib import Path
 from typing import cast
@@ -16,6 +18,21 @@ app = typer.Typer(
 TEMPLATE_DIR = Path(__file__).resolve().parents[2] / ".github" / "workflows"
 
 
+@functools.cache
+def _template_files() -> tuple[Path, ...]:
+    """Return the bundled workflow templates, scanning ``TEMPLATE_DIR`` once."""
+    try:
+        with os.scandir(TEMPLATE_DIR) as it:
+            names = [
+                entry.name
+                for entry in it
+                if entry.name.endswith((".yml", ".yaml")) and entry.is_file()
+            ]
+    except FileNotFoundError:
+        return ()
+    return tuple(TEMPLATE_DIR / name for name in sorted(names))
+
+
 @app.callback()
 def init_workflows(
     ctx: typer.Context,
@@ -39,7 +56,7 @@ def init_workflows(
     ),
 ) -> None:
     """Copy workflow templates into ``dest``."""
-    files = list(TEMPLATE_DIR.glob("*.yml")) + list(TEMPLATE_DIR.glob("*.yaml"))
+    files = _template_files()
     if not files:
         typer.echo("No workflow templates found", err=True)
         raise typer.Exit(1)
@@ -49,9 +66,11 @@ def init_workflows(
     dry_run = resolve_bool(ctx, "dry_run", dry_run, cfg, "DRY_RUN")
     yes = resolve_bool(ctx, "yes", yes, cfg, "YES")
     dest.mkdir(parents=True, exist_ok=True)
+    with os.scandir(dest) as it:
+        existing = {entry.name for entry in it}
     for src in files:
         target = dest / src.name
-        if target.exists():
+        if src.name in existing:
             if not overwrite:
                 typer.echo(f"Skipping {target} (exists). Use --overwrite to replace.")
                 continue
@@ -62,5 +81,5 @@ def init_workflows(
         if dry_run:
             typer.echo(f"Would copy {src} -> {target}")
         else:
-            shutil.copy2(src, target)
+            shutil.copyfile(src, target)
             typer.echo(f"Copied {src.name}")
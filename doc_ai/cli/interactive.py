@@ -39,7 +39,7 @@ import doc_ai.batch as batch_mod
 from doc_ai import plugins
 from doc_ai.batch import run_batch
 
-from .utils import prompt_choice
+from .utils import dir_signature, prompt_choice
 
 # Provide a local shim for click's deprecated MultiCommand without touching the
 # global Click namespace.  Older versions of ``click-repl`` still reference
@@ -108,11 +108,10 @@ def _safe_repl_env(cfg: Mapping[str, object] | None = None) -> dict[str, str]:
     else:
         raw = None
     allow, deny = _parse_allow_deny(raw)
-    return {
-        name: os.environ[name]
-        for name in os.environ
-        if name in allow and name not in deny
-    }
+    # The allow list is tiny next to os.environ, so probe it instead of
+    # scanning every environment variable.
+    environ = os.environ
+    return {name: environ[name] for name in sorted(allow - deny) if name in environ}
 
 
 PROMPT_KWARGS: dict[str, object] | None = None
@@ -729,36 +728,83 @@ def _register_repl_commands(ctx: click.Context) -> None:
     plugins.register_repl_command(":set-default", _repl_set_default)
 
 
+_ANALYSIS_PROMPT_RE = re.compile(r"analysis_(.+)\.prompt\.yaml$")
+
+
 def discover_topics(doc_type: str, data_dir: Path = Path("data")) -> list[str]:
     """Return sorted topics available under *doc_type* in ``data_dir``."""
 
+    typed_re = re.compile(rf"{re.escape(doc_type)}\.analysis\.(.+)\.prompt\.yaml$")
     topics: set[str] = set()
-    doc_dir = data_dir / doc_type
-    if not doc_dir.exists():
+    try:
+        with os.scandir(data_dir / doc_type) as entries:
+            for entry in entries:
+                m = _ANALYSIS_PROMPT_RE.match(entry.name) or typed_re.match(entry.name)
+                if m:
+                    topics.add(m.group(1))
+    except (FileNotFoundError, NotADirectoryError):
         return []
-    for p in doc_dir.glob("analysis_*.prompt.yaml"):
-        m = re.match(r"analysis_(.+)\.prompt\.yaml$", p.name)
-        if m:
-            topics.add(m.group(1))
-    for p in doc_dir.glob(f"{doc_type}.analysis.*.prompt.yaml"):
-        m = re.match(rf"{re.escape(doc_type)}\.analysis\.(.+)\.prompt\.yaml$", p.name)
-        if m:
-            topics.add(m.group(1))
     return sorted(topics)
 
 
+# Discovery results keyed on the resolved data directory. Each entry records
+# the stat signatures of the data directory and its doc-type folders so a
+# created, renamed or deleted prompt file invalidates it automatically.
+_DISCOVERY_CACHE: dict[
+    Path,
+    tuple[tuple[tuple[str, tuple[int, int, int]], ...], tuple[list[str], list[str]]],
+] = {}
+
+
 def discover_doc_types_topics(
     data_dir: Path = Path("data"),
 ) -> tuple[list[str], list[str]]:
     """Return sorted document types and analysis topics under ``data_dir``."""
 
-    if not data_dir.exists():
+    try:
+        key = data_dir.resolve()
+        signature = [("", dir_signature(os.stat(data_dir)))]
+        with os.scandir(data_dir) as entries:
+            doc_types = []
+            for entry in entries:
+                if entry.is_dir():
+                    doc_types.append(entry.name)
+                    signature.append((entry.name, dir_signature(entry.stat())))
+    except OSError:
         return [], []
-    doc_types = [p.name for p in data_dir.iterdir() if p.is_dir()]
+    sig = tuple(sorted(signature))
+    cached = _DISCOVERY_CACHE.get(key)
+    if cached is not None and cached[0] == sig:
+        found_types, found_topics = cached[1]
+        return list(found_types), list(found_topics)
     topics: set[str] = set()
     for dtype in doc_types:
         topics.update(discover_topics(dtype, data_dir))
-    return sorted(doc_types), sorted(topics)
+    result = (sorted(doc_types), sorted(topics))
+    _DISCOVERY_CACHE[key] = (sig, result)
+    return list(result[0]), list(result[1])
+
+
+class _CaseInsensitiveWords(WordCompleter):
+    """``WordCompleter`` that lower-cases its words once instead of per keystroke."""
+
+    def __init__(self, words: Iterable[str]) -> None:
+        super().__init__(list(words), ignore_case=True)
+        self._lowered = tuple(word.lower() for word in self.words)
+
+    def get_completions(
+        self, document: Document, complete_event: CompleteEvent
+    ) -> Iterable[Completion]:
+        prefix = document.get_word_before_cursor(WORD=self.WORD, pattern=self.pattern)
+        lowered_prefix = prefix.lower()
+        for word, lowered in zip(self.words, self._lowered):
+            if lowered.startswith(lowered_prefix):
+                yield Completion(text=word, start_position=-len(prefix))
+
+
+# Commands whose first argument is a document type.
+_DOC_TYPE_COMMANDS = frozenset({"pipeline", "urls"})
+_TOPIC_FLAGS = frozenset({"--topic", "-t"})
 
 
 class DocAICompleter(Completer):
@@ -766,9 +812,9 @@ class DocAICompleter(Completer):
 
     def __init__(self, cli: Command, ctx: click.Context) -> None:
         self._click = ClickCompleter(cli, ctx)
-        self._env = WordCompleter([], ignore_case=True)
-        self._doc_types = WordCompleter([], ignore_case=True)
-        self._topics = WordCompleter([], ignore_case=True)
+        self._env = _CaseInsensitiveWords(())
+        self._doc_types = _CaseInsensitiveWords(())
+        self._topics = _CaseInsensitiveWords(())
         self._ctx = ctx
         self.refresh()
 
@@ -786,7 +832,7 @@ class DocAICompleter(Completer):
         if self._ctx.obj and isinstance(self._ctx.obj.get("config"), dict):
             cfg.update(self._ctx.obj["config"])
         env_words = [f"${name}" for name in _safe_repl_env(cfg)]
-        self._env = WordCompleter(env_words, ignore_case=True)
+        self._env = _CaseInsensitiveWords(env_words)
 
         doc_types, topics = discover_doc_types_topics(Path("data"))
         default_doc_type = cfg.get("default_doc_type")
@@ -797,8 +843,23 @@ class DocAICompleter(Completer):
             ]
         if default_topic in topics:
             topics = [default_topic] + [t for t in topics if t != default_topic]
-        self._doc_types = WordCompleter(doc_types, ignore_case=True)
-        self._topics = WordCompleter(topics, ignore_case=True)
+        self._doc_types = _CaseInsensitiveWords(doc_types)
+        self._topics = _CaseInsensitiveWords(topics)
+
+    def _route(
+        self, text: str, parts: list[str]
+    ) -> tuple[_CaseInsensitiveWords, str] | None:
+        """Return the word completer and prefix for doc type/topic positions."""
+        if parts[0] in _DOC_TYPE_COMMANDS:
+            if len(parts) == 1 and text.endswith(" "):
+                return self._doc_types, ""
+            if len(parts) == 2 and not parts[1].startswith("-"):
+                return self._doc_types, parts[1]
+        if parts[-1] in _TOPIC_FLAGS:
+            return self._topics, ""
+        if len(parts) >= 2 and parts[-2] in _TOPIC_FLAGS:
+            return self._topics, parts[-1]
+        return None
 
     def get_completions(
         self, document: Document, complete_event: CompleteEvent
@@ -809,41 +870,11 @@ class DocAICompleter(Completer):
             return
 
         parts = text.split()
-        if parts:
-            cmd = parts[0]
-            if cmd == "pipeline":
-                if len(parts) == 1 and text.endswith(" "):
-                    yield from self._doc_types.get_completions(
-                        Document(""), complete_event
-                    )
-                    return
-                if len(parts) == 2 and not parts[1].startswith("-"):
-                    yield from self._doc_types.get_completions(
-                        Document(parts[1]), complete_event
-                    )
-                    return
-            if "--topic" in parts or "-t" in parts:
-                if parts[-1] in {"--topic", "-t"}:
-                    yield from self._topics.get_completions(
-                        Document(""), complete_event
-                    )
-                    return
-                if len(parts) >= 2 and parts[-2] in {"--topic", "-t"}:
-                    yield from self._topics.get_completions(
-                        Document(parts[-1]), complete_event
-                    )
-                    return
-            if cmd == "urls":
-                if len(parts) == 1 and text.endswith(" "):
-                    yield from self._doc_types.get_completions(
-                        Document(""), complete_event
-                    )
-                    return
-                if len(parts) == 2 and not parts[1].startswith("-"):
-                    yield from self._doc_types.get_completions(
-                        Document(parts[1]), complete_event
-                    )
-                    return
+        route = self._route(text, parts) if parts else None
+        if route is not None:
+            completer, prefix = route
+            yield from completer.get_completions(Document(prefix), complete_event)
+            return
 
         yield from self._click.get_completions(document, complete_event)
         for provider in plugins.iter_completion_providers():
@@ -853,6 +884,7 @@ class DocAICompleter(Completer):
 def refresh_completer() -> None:
     """Refresh the interactive completer if the REPL is active."""
 
+    _DISCOVERY_CACHE.clear()
     comp = PROMPT_KWARGS.get("completer") if PROMPT_KWARGS else None
     if isinstance(comp, DocAICompleter):
         comp.refresh()
@@ -881,6 +913,23 @@ def _prompt_name() -> str:
     return Path.cwd().name
 
 
+def _ensure_private_file(path: Path) -> None:
+    """Create *path* with mode ``0600``, tightening an existing file if needed."""
+
+    try:
+        fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+    except FileExistsError:
+        if os.name == "nt":
+            return
+        try:
+            if stat.S_IMODE(os.stat(path).st_mode) != 0o600:
+                os.chmod(path, 0o600)
+        except OSError:
+            pass
+    else:
+        os.close(fd)
+
+
 def interactive_shell(app: typer.Typer, init: Path | None = None) -> None:
     """Start an interactive REPL for the given Typer application.
 
@@ -932,15 +981,8 @@ def interactive_shell(app: typer.Typer, init: Path | None = None) -> None:
                 except OSError:
                     pass
             history_path = data_dir / "history"
-        exists = history_path.exists()
-        history_path.touch(mode=0o600, exist_ok=True)
-        if os.name != "nt":
-            if exists:
-                try:
-                    history_path.chmod(0o600)
-                except OSError:
-                    pass
-        else:
+        _ensure_private_file(history_path)
+        if os.name == "nt":
             try:
                 mode = history_path.stat().st_mode
                 if os.access(history_path, os.R_OK) and mode & (
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import logging
+import os
+import re
+from collections.abc import Iterator
 from pathlib import Path
-from urllib.parse import urlparse
 
 import click
 import questionary
@@ -29,14 +31,18 @@ def _load_urls(doc_type: str) -> tuple[Path, list[str]]:
     path = _url_file(doc_type)
     urls: list[str] = []
     if path.exists():
-        urls = [
-            line.strip()
-            for line in path.read_text(encoding="utf-8").splitlines()
-            if line.strip()
-        ]
+        with path.open(encoding="utf-8") as fh:
+            urls = [line for line in map(str.strip, fh) if line]
     return path, urls
 
 
+def _iter_url_entries(path: Path) -> Iterator[str]:
+    """Yield whitespace-separated entries from *path* one line at a time."""
+    with path.open(encoding="utf-8") as fh:
+        for line in fh:
+            yield from line.split()
+
+
 def show_urls(doc_type: str) -> tuple[Path, list[str]]:
     """Display and return stored URLs for ``doc_type``."""
     path, urls = _load_urls(doc_type)
@@ -58,15 +64,33 @@ def save_urls(path: Path, urls: list[str]) -> None:
             unique[lower] = url
     final = list(unique.values())
     path.parent.mkdir(parents=True, exist_ok=True)
-    tmp = path.with_suffix(".tmp")
-    tmp.write_text("\n".join(final) + ("\n" if final else ""), encoding="utf-8")
-    tmp.replace(path)
+    # Same-directory temp file so the final rename never crosses filesystems.
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with tmp.open("w", encoding="utf-8") as fh:
+            fh.write("\n".join(final) + ("\n" if final else ""))
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    if os.name != "nt":
+        # Persist the rename itself so a crash cannot resurrect the old list.
+        dir_fd = os.open(path.parent, os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+# ``http``/``https`` scheme followed by a non-empty network location.
+_URL_RE = re.compile(r"https?://[^\s/?#]+", re.IGNORECASE)
 
 
 def _valid_url(url: str) -> bool:
     """Return ``True`` if *url* looks like an HTTP/HTTPS URL."""
-    parsed = urlparse(url)
-    return bool(parsed.scheme in {"http", "https"} and parsed.netloc)
+    return _URL_RE.match(url) is not None
 
 
 @app.command("list")
@@ -140,12 +164,10 @@ def import_urls(
     file_path = file.expanduser()
     if not file_path.exists():
         raise typer.BadParameter(f"File not found: {file_path}")
-    raw = file_path.read_text(encoding="utf-8")
     path, urls = _load_urls(doc_type)
     lower_urls = {u.lower() for u in urls}
     new_urls: list[str] = []
-    for entry in raw.split():
-        entry = entry.strip()
+    for entry in _iter_url_entries(file_path):
         if not _valid_url(entry):
             typer.echo(f"Skipping invalid URL: {entry}")
             continue
@@ -297,11 +319,9 @@ def manage_urls(ctx: typer.Context) -> None:
             if not file_path.exists():
                 typer.echo(f"File not found: {file_path}")
                 continue
-            raw = file_path.read_text(encoding="utf-8")
             new_urls: list[str] = []
             lower_urls = {u.lower() for u in urls}
-            for url in raw.split():
-                url = url.strip()
+            for url in _iter_url_entries(file_path):
                 if not _valid_url(url):
                     typer.echo(f"Skipping invalid URL: {url}")
                     continue
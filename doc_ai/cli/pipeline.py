@@ -2,10 +2,12 @@
 from __future__ import annotations
 
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from enum import Enum
+from itertools import islice
 from pathlib import Path
-from threading import Lock
+from threading import Event, Lock
 from typing import List, Optional
 
 import typer
@@ -121,21 +123,30 @@ def pipeline(
             self.path = path
             self.exc = exc
 
+    raw_suffixes = RAW_SUFFIXES
     raw_files = [
         f
-        for ext in RAW_SUFFIXES
-        for f in source.rglob(f"*{ext}")
-        if f.is_file() and not any(".converted" in part for part in f.parts)
+        for f in source.rglob("*")
+        if f.suffix in raw_suffixes
+        and f.is_file()
+        and not any(".converted" in part for part in f.parts)
     ]
 
+    md_suffix = _suffix(OutputFormat.MARKDOWN)
+
+    # Set on the first failure in fail-fast mode so no further documents start.
+    stop = Event()
+
     def process(raw_file: Path) -> None:
+        if fail_fast and stop.is_set():
+            return
         local_failures: list[tuple[str, Path, Exception]] = []
         if dry_run:
             if should_run(PipelineStep.CONVERT):
                 logger.info(
                     "Would convert %s to %s", raw_file, ", ".join(f.value for f in fmts)
                 )
-            md_file = raw_file.with_name(raw_file.name + _suffix(OutputFormat.MARKDOWN))
+            md_file = raw_file.with_name(raw_file.name + md_suffix)
             if should_run(PipelineStep.VALIDATE):
                 logger.info("Would validate %s", md_file)
             if should_run(PipelineStep.ANALYZE):
@@ -153,7 +164,7 @@ def pipeline(
                 local_failures.append(("conversion", raw_file, exc))
                 logger.exception("Conversion failed for %s", raw_file)
                 logger.error("[red]Conversion failed for %s: %s[/red]", raw_file, exc)
-        md_file = raw_file.with_name(raw_file.name + _suffix(OutputFormat.MARKDOWN))
+        md_file = raw_file.with_name(raw_file.name + md_suffix)
         if md_file.exists() and should_run(PipelineStep.VALIDATE):
             try:
                 _validate_doc(
@@ -193,6 +204,7 @@ def pipeline(
                     logger.error("[red]Analysis failed for %s: %s[/red]", md_file, exc)
         if local_failures:
             if fail_fast:
+                stop.set()
                 step, path, exc = local_failures[0]
                 raise PipelineError(step, path, exc) from exc
             with lock:
@@ -201,18 +213,30 @@ def pipeline(
     with Progress(transient=True) as progress:
         task = progress.add_task("Processing documents", total=len(raw_files))
         if fail_fast:
+            # Keep up to ``workers`` documents in flight so their model calls
+            # overlap. After the first failure no new document is started;
+            # documents already running finish their current steps.
+            pending_files = iter(raw_files)
+            in_flight: deque[Future] = deque()
             with ThreadPoolExecutor(max_workers=workers) as executor:
-                for raw_file in raw_files:
-                    fut = executor.submit(process, raw_file)
+                for raw_file in islice(pending_files, max(workers, 1)):
+                    in_flight.append(executor.submit(process, raw_file))
+                while in_flight:
+                    fut = in_flight.popleft()
                     try:
                         fut.result()
                     except PipelineError as pe:  # pragma: no cover - error handling
                         failures.append((pe.step, pe.path, pe.exc))
+                        for other in in_flight:
+                            other.cancel()
                         break
                     finally:
                         progress.advance(task)
-                    if failures:
-                        break
+                    if stop.is_set():
+                        continue
+                    raw_file = next(pending_files, None)
+                    if raw_file is not None:
+                        in_flight.append(executor.submit(process, raw_file))
         else:
             with ThreadPoolExecutor(max_workers=workers) as executor:
                 futures = {executor.submit(process, f): f for f in raw_files}
@@ -268,7 +292,10 @@ def _entrypoint(
     fail_fast: bool = typer.Option(
         True,
         "--fail-fast/--keep-going",
-        help="Stop processing on first validation or analysis failure",
+        help=(
+            "Stop processing on first validation or analysis failure. "
+            "With --workers > 1, documents already in progress finish first."
+        ),
     ),
     show_cost: bool = typer.Option(
         False,
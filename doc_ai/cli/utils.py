@@ -23,9 +23,11 @@ except AttributeError:  # pragma: no cover - older questionary releases
 from doc_ai.converter import OutputFormat, suffix_for_format
 from doc_ai.metadata import (
     compute_hash,
+    compute_hash_blake3,
     is_step_done,
     load_metadata,
     mark_step,
+    refresh_hashes,
     save_metadata,
 )
 
@@ -78,11 +80,18 @@ EXTENSION_MAP = {
     ".csv": OutputFormat.CSV,
     ".summary.txt": OutputFormat.SUMMARY_TXT,
 }
+_VALID_EXTENSIONS = ", ".join(EXTENSION_MAP)
+
+
+# Converted-file suffix for each output format, e.g. ``.converted.md``.
+SUFFIXES: dict[OutputFormat, str] = {
+    fmt: f".converted{suffix_for_format(fmt)}" for fmt in OutputFormat
+}
 
 
 def suffix(fmt: OutputFormat) -> str:
     """Return the standard suffix for a converted file."""
-    return f".converted{suffix_for_format(fmt)}"
+    return SUFFIXES[fmt]
 
 
 def infer_format(path: Path) -> OutputFormat:
@@ -92,9 +101,9 @@ def infer_format(path: Path) -> OutputFormat:
     try:
         return EXTENSION_MAP[path.suffix.lower()]
     except KeyError as exc:
-        valid = ", ".join(EXTENSION_MAP.keys())
         raise typer.BadParameter(
-            f"Unknown file extension '{path.suffix}'. Expected one of: {valid}"
+            f"Unknown file extension '{path.suffix}'. "
+            f"Expected one of: {_VALID_EXTENSIONS}"
         ) from exc
 
 
@@ -118,24 +127,33 @@ def parse_env_formats() -> list[OutputFormat] | None:
 T = TypeVar("T")
 
 
+_FORMATS_BY_VALUE = {fmt.value: fmt for fmt in OutputFormat}
+
+
+def parse_formats(values: Sequence[str]) -> list[OutputFormat]:
+    """Return formats from ``values``, splitting comma-separated entries."""
+    formats: list[OutputFormat] = []
+    for raw in values:
+        for val in raw.split(","):
+            fmt = _FORMATS_BY_VALUE.get(val.strip())
+            if fmt is None:
+                valid = ", ".join(_FORMATS_BY_VALUE)
+                raise typer.BadParameter(
+                    f"Invalid output format '{val}'. Choose from: {valid}"
+                )
+            formats.append(fmt)
+    return formats
+
+
 def parse_config_formats(cfg: Mapping[str, str]) -> list[OutputFormat] | None:
     """Return formats from config mapping if set."""
     env_val = cfg.get("OUTPUT_FORMATS")
     if not env_val:
         return None
-    formats: list[OutputFormat] = []
-    for val in env_val.split(","):
-        try:
-            formats.append(OutputFormat(val.strip()))
-        except ValueError as exc:
-            valid = ", ".join(f.value for f in OutputFormat)
-            raise typer.BadParameter(
-                f"Invalid output format '{val}'. Choose from: {valid}"
-            ) from exc
-    return formats
+    return parse_formats([env_val])
 
 
-TRUE_SET = {"1", "true", "yes"}
+TRUE_SET = frozenset({"1", "true", "yes"})
 
 
 def resolve_bool(
@@ -323,6 +341,48 @@ def load_env_defaults() -> dict[str, str | None]:
     return dict(DEFAULT_ENV_VARS)
 
 
+def _stat_key(path: Path) -> list[int]:
+    """Return ``[size, mtime_ns]`` for *path* as stored in step inputs."""
+    st = path.stat()
+    return [st.st_size, st.st_mtime_ns]
+
+
+def dir_signature(st: os.stat_result) -> tuple[int, int, int]:
+    """Return the stat fields used to detect that a directory has changed."""
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+
+# Directory listings used for prompt lookups, keyed on path and validated
+# against the directory's stat signature.
+_DIR_ENTRIES_CACHE: dict[str, tuple[tuple[int, int, int], frozenset[str]]] = {}
+
+
+def _dir_entries(directory: Path) -> frozenset[str]:
+    """Return the entry names in *directory*, reusing an unchanged listing."""
+    key = os.fspath(directory)
+    try:
+        sig = dir_signature(os.stat(key))
+        cached = _DIR_ENTRIES_CACHE.get(key)
+        if cached is not None and cached[0] == sig:
+            return cached[1]
+        with os.scandir(key) as it:
+            names = frozenset(entry.name for entry in it)
+    except OSError:
+        return frozenset()
+    _DIR_ENTRIES_CACHE[key] = (sig, names)
+    return names
+
+
+# Matches a leading ```/```json code fence up to its first closing fence.
+_FENCE_RE = re.compile(r"```(?:json)?\n([\s\S]*?)\n```")
+
+
+def _strip_code_fence(text: str) -> str:
+    """Return the body of the code fence opening *text*, if any."""
+    fence = _FENCE_RE.match(text)
+    return fence.group(1).strip() if fence else text
+
+
 def validate_doc(
     raw: Path,
     rendered: Path,
@@ -336,8 +396,13 @@ def validate_doc(
     validate_file_func: Callable | None = None,
     *,
     force: bool = False,
+    file_hash: str | None = None,
 ) -> None:
-    """Validate a converted document against its raw source."""
+    """Validate a converted document against its raw source.
+
+    Pass *file_hash* when the blake2b checksum of *raw* is already known, for
+    example from :func:`doc_ai.metadata.compute_hashes`.
+    """
     from datetime import datetime, timezone
 
     import click
@@ -346,26 +411,29 @@ def validate_doc(
         from doc_ai.cli import validate_file as validate_file_func  # type: ignore
 
     meta = load_metadata(raw)
-    file_hash = compute_hash(raw)
-    if not force and meta.blake2b == file_hash and is_step_done(meta, "validation"):
+    raw_stat = _stat_key(raw)
+    if not force and is_step_done(meta, "validation"):
+        prev_inputs = meta.extra.get("inputs", {}).get("validation", {})
+        if prev_inputs.get("stat") == raw_stat:
+            return
+    unchanged = refresh_hashes(meta, raw, file_hash)
+    if not force and unchanged and is_step_done(meta, "validation"):
         return
-    if meta.blake2b != file_hash:
-        meta.blake2b = file_hash
-        meta.extra = {}
     if fmt is None:
         fmt = EXTENSION_MAP.get(rendered.suffix)
         if fmt is None:
-            valid = ", ".join(EXTENSION_MAP.keys())
             raise typer.BadParameter(
-                f"Unknown file extension '{rendered.suffix}'. Expected one of: {valid}"
+                f"Unknown file extension '{rendered.suffix}'. "
+                f"Expected one of: {_VALID_EXTENSIONS}"
             )
     prompt_path = prompt
     if prompt_path is None:
         doc_prompt = raw.with_name(f"{raw.stem}.validate.prompt.yaml")
         dir_prompt = raw.with_name("validate.prompt.yaml")
-        if doc_prompt.exists():
+        siblings = _dir_entries(raw.parent)
+        if doc_prompt.name in siblings:
             prompt_path = doc_prompt
-        elif dir_prompt.exists():
+        elif dir_prompt.name in siblings:
             prompt_path = dir_prompt
         else:
             repo_root = Path(__file__).resolve().parents[2]
@@ -401,6 +469,7 @@ def validate_doc(
             "document": str(raw),
             "validated_at": now,
             "verdict": verdict,
+            "stat": raw_stat,
         },
     )
     save_metadata(raw, meta)
@@ -408,6 +477,29 @@ def validate_doc(
         raise click.ClickException(f"Mismatch detected: {verdict}")
 
 
+def _analysis_prompt_path(markdown_doc: Path, topic: str | None) -> Path:
+    """Return the analysis prompt to use for *markdown_doc* and *topic*."""
+    parent = markdown_doc.parent
+    repo_root = Path(__file__).resolve().parents[2]
+    default = repo_root / ".github/prompts/doc-analysis.analysis.prompt.yaml"
+    if topic:
+        candidates = [
+            parent / f"{parent.name}.analysis.{topic}.prompt.yaml",
+            parent / f"analysis_{topic}.prompt.yaml",
+            repo_root / f".github/prompts/doc-analysis.analysis.{topic}.prompt.yaml",
+            repo_root / f".github/prompts/doc-analysis.analysis_{topic}.prompt.yaml",
+        ]
+    else:
+        candidates = [
+            parent / f"{parent.name}.analysis.prompt.yaml",
+            parent / "analysis.prompt.yaml",
+        ]
+    for candidate in candidates:
+        if candidate.name in _dir_entries(candidate.parent):
+            return candidate
+    return default
+
+
 def analyze_doc(
     markdown_doc: Path,
     prompt: Path | None = None,
@@ -420,121 +512,93 @@ def analyze_doc(
     topic: str | None = None,
     run_prompt_func: Callable | None = None,
     *,
+    topics: Sequence[str | None] | None = None,
     force: bool = False,
+    file_hash: str | None = None,
 ) -> None:
-    """Run an analysis prompt on a markdown document and store results."""
+    """Run an analysis prompt on a markdown document and store results.
+
+    Pass *topics* to analyze several topics in one call. The document, its
+    hash and its metadata are then loaded once and shared across topics.
+    *file_hash* supplies a precomputed blake2b checksum of *markdown_doc*.
+    """
     import json
-    import re
 
     if run_prompt_func is None:
         from doc_ai.cli import run_prompt as run_prompt_func  # type: ignore
 
-    step_name = "analysis" if topic is None else f"analysis:{topic}"
+    topic_list = list(topics) if topics is not None else [topic]
+    md_name = markdown_doc.name
     raw_doc = markdown_doc
-    if ".converted" in markdown_doc.suffixes:
-        raw_doc = raw_doc.with_suffix("").with_suffix("")
+    if ".converted." in md_name or md_name.endswith(".converted"):
+        raw_doc = markdown_doc.with_name(md_name.rsplit(".", 2)[0])
+    # ``doc.pdf.converted.md`` -> ``doc.pdf``; prefix for analysis outputs.
+    out_base = md_name.removesuffix(".md").removesuffix(".converted")
     meta = load_metadata(raw_doc)
-    md_hash = compute_hash(markdown_doc)
-    prev_hash = None
-    if meta.extra:
-        prev_hash = (
-            meta.extra.get("inputs", {}).get(step_name, {}).get("markdown_blake2b")
+    md_stat = _stat_key(markdown_doc)
+    md_fast_hash = functools.cache(lambda: compute_hash_blake3(markdown_doc))
+    md_hash = functools.cache(lambda: file_hash or compute_hash(markdown_doc))
+    doc_text: str | None = None
+    for topic in topic_list:
+        step_name = "analysis" if topic is None else f"analysis:{topic}"
+        prev_inputs = {}
+        if meta.extra:
+            prev_inputs = meta.extra.get("inputs", {}).get(step_name, {})
+        if not force and is_step_done(meta, step_name):
+            if prev_inputs.get("stat") == md_stat:
+                continue
+            if md_fast_hash() is not None and (
+                prev_inputs.get("markdown_blake3") == md_fast_hash()
+            ):
+                continue
+            if prev_inputs.get("markdown_blake2b") == md_hash():
+                continue
+
+        prompt_path = prompt or _analysis_prompt_path(markdown_doc, topic)
+        if doc_text is None:
+            doc_text = markdown_doc.read_text(encoding="utf-8")
+        result, _ = run_prompt_func(
+            prompt_path,
+            doc_text,
+            model=model,
+            base_url=base_url,
+            show_cost=show_cost,
+            estimate=estimate,
         )
-    if not force and is_step_done(meta, step_name) and prev_hash == md_hash:
-        return
-
-    prompt_path = prompt
-    if prompt_path is None:
-        parent = markdown_doc.parent
-        if topic:
-            type_prompt = parent / f"{parent.name}.analysis.{topic}.prompt.yaml"
-            topic_prompt = parent / f"analysis_{topic}.prompt.yaml"
-            if type_prompt.exists():
-                prompt_path = type_prompt
-            elif topic_prompt.exists():
-                prompt_path = topic_prompt
-            else:
-                repo_root = Path(__file__).resolve().parents[2]
-                alt1 = (
-                    repo_root
-                    / f".github/prompts/doc-analysis.analysis.{topic}.prompt.yaml"
-                )
-                alt2 = (
-                    repo_root
-                    / f".github/prompts/doc-analysis.analysis_{topic}.prompt.yaml"
-                )
-                if alt1.exists():
-                    prompt_path = alt1
-                elif alt2.exists():
-                    prompt_path = alt2
-                else:
-                    prompt_path = (
-                        repo_root / ".github/prompts/doc-analysis.analysis.prompt.yaml"
-                    )
+        result = _strip_code_fence(result.strip())
+        parsed: dict | list | None = None
+        try:
+            parsed = json.loads(result)
+        except json.JSONDecodeError:
+            if require_json:
+                raise ValueError("Analysis result is not valid JSON")
+        if output:
+            out_path = output
         else:
-            type_prompt = parent / f"{parent.name}.analysis.prompt.yaml"
-            dir_prompt = parent / "analysis.prompt.yaml"
-            if type_prompt.exists():
-                prompt_path = type_prompt
-            elif dir_prompt.exists():
-                prompt_path = dir_prompt
-            else:
-                repo_root = Path(__file__).resolve().parents[2]
-                prompt_path = (
-                    repo_root / ".github/prompts/doc-analysis.analysis.prompt.yaml"
-                )
-
-    result, _ = run_prompt_func(
-        prompt_path,
-        markdown_doc.read_text(),
-        model=model,
-        base_url=base_url,
-        show_cost=show_cost,
-        estimate=estimate,
-    )
-    result = result.strip()
-    fence = re.match(r"```(?:json)?\n([\s\S]*?)\n```", result)
-    if fence:
-        result = fence.group(1).strip()
-    parsed: dict | list | None = None
-    try:
-        parsed = json.loads(result)
-    except json.JSONDecodeError:
-        if require_json:
-            raise ValueError("Analysis result is not valid JSON")
-    if output:
-        out_path = output
-    else:
-        base = markdown_doc
-        if base.suffix == ".md":
-            base = base.with_suffix("")
-        if base.suffix == ".converted":
-            base = base.with_suffix("")
-        topic_part = f".{topic}" if topic else ""
-        suffix = (
-            f".analysis{topic_part}.json"
-            if parsed is not None
-            else f".analysis{topic_part}.txt"
+            topic_part = f".{topic}" if topic else ""
+            suffix = (
+                f".analysis{topic_part}.json"
+                if parsed is not None
+                else f".analysis{topic_part}.txt"
+            )
+            out_path = markdown_doc.with_name(f"{out_base}{suffix}")
+        if parsed is not None:
+            out_path.write_text(json.dumps(parsed, indent=2) + "\n", encoding="utf-8")
+        else:
+            out_path.write_text(result + "\n", encoding="utf-8")
+        logger.info(
+            "[green]Analyzed %s -> %s (SUCCESS)[/]",
+            markdown_doc,
+            out_path,
         )
-        out_path = base.with_name(f"{base.name}{suffix}")
-    if parsed is not None:
-        out_path.write_text(json.dumps(parsed, indent=2) + "\n", encoding="utf-8")
-    else:
-        out_path.write_text(result + "\n", encoding="utf-8")
-    logger.info(
-        "[green]Analyzed %s -> %s (SUCCESS)[/]",
-        markdown_doc,
-        out_path,
-    )
-    mark_step(
-        meta,
-        step_name,
-        outputs=[out_path.name],
-        inputs={
+        inputs = {
             "prompt": prompt_path.name,
             "markdown": markdown_doc.name,
-            "markdown_blake2b": md_hash,
+            "markdown_blake2b": md_hash(),
             "topic": topic,
-        },
-    )
-    save_metadata(raw_doc, meta)
+            "stat": md_stat,
+        }
+        if md_fast_hash() is not None:
+            inputs["markdown_blake3"] = md_fast_hash()
+        mark_step(meta, step_name, outputs=[out_path.name], inputs=inputs)
+        save_metadata(raw_doc, meta)
@@ -4,22 +4,19 @@ from pathlib import Path
 from typing import Optional
 
 import typer
-from rich.console import Console
 
 from doc_ai.converter import OutputFormat
 
-from . import ModelName, _validate_prompt
-from .utils import (
-    infer_format as _infer_format,
-)
+from . import ModelName, _validate_prompt, console
 from .utils import (
+    SUFFIXES,
     prompt_if_missing,
     resolve_bool,
     resolve_str,
     validate_doc,
 )
 from .utils import (
-    suffix as _suffix,
+    infer_format as _infer_format,
 )
 
 app = typer.Typer(
@@ -80,10 +77,9 @@ def validate(
     )
     force = resolve_bool(ctx, "force", force, cfg, "FORCE")
 
-    console_local = Console()
     if rendered is None:
         used_fmt = fmt or OutputFormat.MARKDOWN
-        rendered = raw.with_name(raw.name + _suffix(used_fmt))
+        rendered = raw.with_name(raw.name + SUFFIXES[used_fmt])
     else:
         used_fmt = fmt or _infer_format(rendered)
 
@@ -95,6 +91,6 @@ def validate(
         model,
         base_model_url,
         show_progress=True,
-        console=console_local,
+        console=console,
         force=force,
     )
@@ -1,10 +1,17 @@
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .document_converter import (
     OutputFormat,
     convert_file,
     convert_files,
     suffix_for_format,
 )
-from .path import convert_path
+
+if TYPE_CHECKING:  # pragma: no cover - imported lazily at runtime
+    from .path import convert_path
 
 __all__ = [
     "OutputFormat",
@@ -13,3 +20,13 @@ __all__ = [
     "suffix_for_format",
     "convert_path",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # ``convert_path`` pulls in Docling's exception types, so only import it
+    # when it is actually used rather than whenever ``OutputFormat`` is needed.
+    if name == "convert_path":
+        value = importlib.import_module(".path", __name__).convert_path
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
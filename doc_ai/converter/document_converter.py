@@ -17,7 +17,7 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, Tuple, Union
 
-from rich.console import Console
+from rich import get_console
 from rich.progress import (
     BarColumn,
     Progress,
@@ -26,14 +26,6 @@ from rich.progress import (
     TextColumn,
 )
 
-try:  # Docling’s converter uses Pydantic which may raise ValidationError
-    from pydantic import ValidationError
-except ImportError:  # pragma: no cover - Pydantic always available in tests
-
-    class ValidationError(Exception):
-        pass
-
-
 # ``Docling`` pulls in heavy dependencies like ``torch`` which can slow down
 # startup considerably.  Import the converter lazily so simply importing this
 # module doesn't trigger those imports.  Tests patch ``_DoclingConverter`` so we
@@ -44,11 +36,25 @@ except ImportError:  # pragma: no cover - Pydantic always available in tests
 _DoclingConverter = None
 _converter_instance = None
 _CACHE_MARKER = Path.home() / ".cache" / "doc_ai" / "docling_ready"
-_console = Console()
+_console = get_console()
 logger = logging.getLogger(__name__)
 _converter_lock = threading.Lock()
 
 
+def _legacy_convert_errors() -> tuple[type[Exception], ...]:
+    """Return errors raised by older Docling versions for ``progress=``.
+
+    Docling's converter uses Pydantic which may raise ``ValidationError``. It
+    is imported here rather than at module level because Pydantic is only
+    loaded alongside Docling and is costly to import on CLI startup.
+    """
+    try:
+        from pydantic import ValidationError
+    except ImportError:  # pragma: no cover - Pydantic always available in tests
+        return (TypeError,)
+    return (TypeError, ValidationError)
+
+
 def _ensure_models_downloaded() -> None:
     """Pre-fetch Docling model assets with progress and caching."""
 
@@ -199,7 +205,7 @@ def convert_files(
             task = progress.add_task(f"Converting {input_path}", total=total)
             try:
                 result = converter.convert(input_path, progress=True)
-            except (TypeError, ValidationError):  # older Docling versions
+            except _legacy_convert_errors():  # older Docling versions
                 result = converter.convert(input_path)
             progress.advance(task)
             status = getattr(result, "status", None)
@@ -208,7 +214,7 @@ def convert_files(
     else:
         try:
             result = converter.convert(input_path, progress=False)
-        except (TypeError, ValidationError):  # older Docling versions
+        except _legacy_convert_errors():  # older Docling versions
             result = converter.convert(input_path)
         status = getattr(result, "status", None)
         doc = result.document
@@ -12,6 +12,7 @@ from rich.progress import Progress
 
 from doc_ai.metadata import (
     compute_hash,
+    compute_hashes,
     is_step_done,
     load_metadata,
     mark_step,
@@ -58,6 +59,9 @@ SUPPORTED_SUFFIXES = {
     ".ogg",
 }
 
+# Bytes requested per read when streaming a remote document to disk.
+_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 def _suffix(fmt: OutputFormat) -> str:
     """Return desired suffix for ``fmt``."""
@@ -100,16 +104,22 @@ def convert_path(
                 return True
             return any(name.endswith(suf) for suf in output_suffixes)
 
-        def handle_file(file: Path, src_url: str | None = None) -> None:
+        def is_candidate(path: Path) -> bool:
+            if is_output_file(path):
+                return False
+            return path.suffix.lower() in SUPPORTED_SUFFIXES
+
+        def handle_file(
+            file: Path, src_url: str | None = None, file_hash: str | None = None
+        ) -> None:
             """Convert ``file`` if it's not already a derived output and hasn't been processed."""
 
-            if is_output_file(file):
-                return
-            if file.suffix.lower() not in SUPPORTED_SUFFIXES:
+            if not is_candidate(file):
                 return
 
             meta = load_metadata(file)
-            file_hash = compute_hash(file)
+            if file_hash is None:
+                file_hash = compute_hash(file)
             if (
                 not force
                 and meta.blake2b == file_hash
@@ -150,11 +160,13 @@ def convert_path(
             handle_file(src, src_url)
         else:
             files = [f for f in src.rglob("*") if f.is_file()]
+            # Hash every candidate up front so the digests run in parallel.
+            hashes = compute_hashes(f for f in files if is_candidate(f))
             if files:
                 with Progress(transient=True) as progress:
                     task = progress.add_task(f"Converting {src}", total=len(files))
                     for file in files:
-                        handle_file(file, src_url)
+                        handle_file(file, src_url, hashes.get(file))
                         progress.advance(task)
             else:
                 for file in files:
@@ -174,7 +186,7 @@ def convert_path(
                     source_path = Path(tmp) / name
                     total = 0
                     with open(source_path, "wb") as fh:
-                        for chunk in resp.iter_content(chunk_size=8192):
+                        for chunk in resp.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE):
                             if not chunk:
                                 continue
                             total += len(chunk)
@@ -8,11 +8,11 @@ import logging
 import os
 import re
 from pathlib import Path
-from typing import Callable, Dict, List, Optional
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
 
 import yaml
 from openai import OpenAI
-from rich.console import Console
+from rich import get_console
 from rich.progress import Progress
 
 from doc_ai.logging import RedactFilter
@@ -22,6 +22,9 @@ from ..openai import create_response, upload_file
 from ..utils import http_get, sanitize_path
 from .prompts import DEFAULT_MODEL_BASE_URL
 
+if TYPE_CHECKING:  # pragma: no cover - used for type checkers only
+    from rich.console import Console
+
 OPENAI_BASE_URL = "https://api.openai.com/v1"
 
 _logger = logging.getLogger(__name__)
@@ -113,7 +116,7 @@ def validate_file(
     upload_task = validate_task = None
     file_ids: List[str] = []
     if show_progress:
-        progress = Progress(console=console or Console())
+        progress = Progress(console=console or get_console())
         progress.start()
         if file_paths:
             total = sum(p.stat().st_size for p in file_paths)
@@ -13,10 +13,11 @@ from concurrent.futures import (
     as_completed,
 )
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import httpx
 from openai import APIConnectionError, APIError, OpenAI, RateLimitError
-from rich.console import Console
+from rich import get_console
 from rich.progress import Progress
 
 from doc_ai.cli import _parse_embed_dimensions
@@ -31,6 +32,9 @@ from ..metadata import (
 )
 from .prompts import DEFAULT_MODEL_BASE_URL
 
+if TYPE_CHECKING:  # pragma: no cover - used for type checkers only
+    from rich.console import Console
+
 EMBED_MODEL = os.getenv("EMBED_MODEL", "openai/text-embedding-3-small")
 try:
     EMBED_DIMENSIONS = _parse_embed_dimensions(os.getenv("EMBED_DIMENSIONS"))
@@ -168,7 +172,7 @@ def build_vector_store(
         mark_step(meta, "vector", outputs=[out_file.name])
         save_metadata(md_file, meta)
 
-    console = console or Console()
+    console = console or get_console()
     total = sum(1 for _ in src_dir.rglob("*.md"))
     md_files = src_dir.rglob("*.md")
     executor_cls = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
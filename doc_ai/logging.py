@@ -67,6 +67,10 @@ class RedactFilter(logging.Filter):
         return True
 
 
+# Settings and handlers installed by the last ``configure_logging`` call.
+_ACTIVE_CONFIG: tuple[tuple[int, str | None, str], list[logging.Handler]] | None = None
+
+
 def configure_logging(
     level: str | int = "WARNING", log_file: str | Path | None = None
 ) -> None:
@@ -79,7 +83,23 @@ def configure_logging(
     else:
         numeric_level = level
 
+    global _ACTIVE_CONFIG
     root = logging.getLogger()
+    key = (
+        numeric_level,
+        os.fspath(log_file) if log_file else None,
+        os.getenv("LOG_REDACTION_PATTERNS", ""),
+    )
+    if (
+        _ACTIVE_CONFIG is not None
+        and _ACTIVE_CONFIG[0] == key
+        and root.level == numeric_level
+        and all(h in root.handlers for h in _ACTIVE_CONFIG[1])
+    ):
+        # Same settings as the last call and our handlers are still attached;
+        # avoid closing and reopening the log file for every command.
+        return
+
     # Close existing handlers to avoid ResourceWarning when reconfiguring
     for handler in list(root.handlers):
         try:
@@ -111,6 +131,8 @@ def configure_logging(
         file_handler.addFilter(redact_filter)
         root.addHandler(file_handler)
 
+    _ACTIVE_CONFIG = (key, list(root.handlers))
+
     logging.captureWarnings(True)
     pywarn = logging.getLogger("py.warnings")
     if numeric_level <= logging.DEBUG:
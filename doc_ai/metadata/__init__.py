@@ -4,14 +4,24 @@
 from __future__ import annotations
 
 import hashlib
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from .dublin_core import DublinCoreDocument
 
+try:  # pragma: no cover - optional speedup
+    import blake3 as _blake3
+except ImportError:  # pragma: no cover - blake3 not installed
+    _blake3 = None
+
 _DEF_STEP_KEY = "steps"
 _DEF_OUTPUT_KEY = "outputs"
 _DEF_INPUT_KEY = "inputs"
+# Files at least this large are memory-mapped and hashed in a single call.
+_MMAP_THRESHOLD = 64 * 1024
 
 
 def metadata_path(doc_path: Path) -> Path:
@@ -21,35 +31,100 @@ def metadata_path(doc_path: Path) -> Path:
 
 def load_metadata(doc_path: Path) -> DublinCoreDocument:
     """Load Dublin Core metadata for ``doc_path`` if present."""
-    meta_file = metadata_path(doc_path)
-    if meta_file.exists():
-        return DublinCoreDocument.from_json(meta_file.read_text(encoding="utf-8"))
-    return DublinCoreDocument()
+    try:
+        data = metadata_path(doc_path).read_bytes()
+    except FileNotFoundError:
+        return DublinCoreDocument()
+    return DublinCoreDocument.from_json(data)
 
 
 def save_metadata(doc_path: Path, meta: DublinCoreDocument) -> None:
     """Persist ``meta`` alongside ``doc_path``.
 
     The size and original filename are refreshed on every save so callers do
-    not need to manage these fields explicitly.
+    not need to manage these fields explicitly. The file is left untouched
+    when its contents would not change.
     """
     meta.size = doc_path.stat().st_size
     extra = meta.extra or {}
     extra.setdefault("filename", doc_path.name)
     meta.extra = extra
     meta_file = metadata_path(doc_path)
-    meta_file.write_text(meta.to_json(), encoding="utf-8")
+    data = meta.to_json_bytes()
+    try:
+        if meta_file.stat().st_size == len(data) and meta_file.read_bytes() == data:
+            return
+    except FileNotFoundError:
+        pass
+    meta_file.write_bytes(data)
 
 
 def compute_hash(doc_path: Path) -> str:
     """Return a blake2b checksum of the file at ``doc_path``."""
     hasher = hashlib.blake2b()
     with doc_path.open("rb") as fh:
-        for chunk in iter(lambda: fh.read(128 * 1024), b""):
-            hasher.update(chunk)
+        if os.fstat(fh.fileno()).st_size >= _MMAP_THRESHOLD:
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                hasher.update(mm)
+        else:
+            for chunk in iter(lambda: fh.read(128 * 1024), b""):
+                hasher.update(chunk)
     return hasher.hexdigest()
 
 
+def compute_hashes(
+    doc_paths: Iterable[Path], max_workers: Optional[int] = None
+) -> Dict[Path, str]:
+    """Return blake2b checksums for ``doc_paths`` keyed by path.
+
+    hashlib releases the GIL while digesting, so files are hashed on a thread
+    pool to use several cores when many documents are checked at once.
+    """
+    paths = list(doc_paths)
+    if len(paths) <= 1:
+        return {path: compute_hash(path) for path in paths}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return dict(zip(paths, executor.map(compute_hash, paths)))
+
+
+def compute_hash_blake3(doc_path: Path) -> Optional[str]:
+    """Return a BLAKE3 checksum of ``doc_path`` or ``None`` if unavailable.
+
+    BLAKE3 is used when the optional ``blake3`` package is installed. It hashes
+    large files on several threads, so it is checked before the slower blake2b
+    digest that remains the canonical checksum.
+    """
+    if _blake3 is None:
+        return None
+    hasher = _blake3.blake3(max_threads=_blake3.blake3.AUTO)
+    hasher.update_mmap(doc_path)
+    return hasher.hexdigest()
+
+
+def refresh_hashes(
+    meta: DublinCoreDocument, doc_path: Path, file_hash: Optional[str] = None
+) -> bool:
+    """Update the checksums in ``meta`` for ``doc_path``.
+
+    Returns ``True`` when the file content is unchanged. A stored BLAKE3
+    checksum is compared first; otherwise the blake2b checksum decides. Pass
+    ``file_hash`` when the blake2b checksum is already known. When the
+    content changed, recorded step state in ``meta.extra`` is cleared.
+    """
+    fast_hash = compute_hash_blake3(doc_path)
+    if fast_hash is not None and meta.blake3 == fast_hash:
+        return True
+    if file_hash is None:
+        file_hash = compute_hash(doc_path)
+    unchanged = meta.blake2b == file_hash
+    if not unchanged:
+        meta.blake2b = file_hash
+        meta.extra = {}
+    if fast_hash is not None or not unchanged:
+        meta.blake3 = fast_hash
+    return unchanged
+
+
 def is_step_done(meta: DublinCoreDocument, step: str) -> bool:
     """Check whether ``step`` was recorded as completed in ``meta``."""
     if meta.extra is None:
@@ -90,6 +165,9 @@ __all__ = [
     "load_metadata",
     "save_metadata",
     "compute_hash",
+    "compute_hashes",
+    "compute_hash_blake3",
+    "refresh_hashes",
     "is_step_done",
     "mark_step",
 ]
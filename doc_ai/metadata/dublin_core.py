@@ -16,6 +16,11 @@ from dataclasses import asdict, dataclass, field
 from typing import Any, Dict, List, Literal, Optional, cast
 from xml.etree import ElementTree
 
+try:  # ``orjson`` is optional; fall back to the stdlib when unavailable
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
 COMPRESSION_TYPE: Optional[Literal["zlib", "lzma"]] = "zlib"
 
 logger = logging.getLogger(__name__)
@@ -138,6 +143,7 @@ class DublinCoreDocument:
     # Non-DC fields to allow for storage of document contents or additional metadata
     content: Optional[bytes] = None
     blake2b: Optional[str] = None
+    blake3: Optional[str] = None
     id: Optional[str] = field(default_factory=lambda: str(uuid.uuid4()))
     size: int = 0
     extra: Optional[Dict[str, int | float | str | tuple | list | dict]] = field(
@@ -220,10 +226,14 @@ class DublinCoreDocument:
             self_dict["content"] = self.encode_content()
         return json.dumps(self_dict, default=self._default_serializer, indent=4)
 
+    def to_json_bytes(self) -> bytes:
+        """Serialize the Dublin Core document to UTF-8 encoded JSON."""
+        return self.to_json().encode("utf-8")
+
     @staticmethod
-    def from_json(json_data: str) -> DublinCoreDocument:
+    def from_json(json_data: str | bytes) -> DublinCoreDocument:
         """Load a DublinCoreDocument from JSON data."""
-        data = json.loads(json_data)
+        data = orjson.loads(json_data) if orjson is not None else json.loads(json_data)
         if "content" in data:
             data["content"] = DublinCoreDocument.decode_content(data["content"])
         document = DublinCoreDocument(**data)
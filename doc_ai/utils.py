@@ -13,12 +13,35 @@ DEFAULT_TIMEOUT = 30
 DEFAULT_RETRIES = 3
 
 
+def retrying_session(
+    *, max_retries: int = DEFAULT_RETRIES, pool_maxsize: int = 10
+) -> requests.Session:
+    """Return a session that retries transient GET failures.
+
+    ``pool_maxsize`` bounds the connections kept open per host, so callers
+    downloading from several threads can reuse one connection per worker.
+    """
+
+    retry = Retry(
+        total=max_retries,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET"],
+    )
+    adapter = HTTPAdapter(max_retries=retry, pool_maxsize=pool_maxsize)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
 def http_get(
     url: str,
     *,
     timeout: int = DEFAULT_TIMEOUT,
     max_retries: int = DEFAULT_RETRIES,
     suppress_raise: bool = False,
+    session: requests.Session | None = None,
     **kwargs: Any,
 ) -> requests.Response:
     """Perform an HTTP GET with retry and timeout defaults.
@@ -27,21 +50,19 @@ def http_get(
     silently ignoring client or server errors, this helper now calls
     :meth:`requests.Response.raise_for_status` on the returned response unless
     ``suppress_raise`` is ``True``.
+
+    Pass a ``session`` from :func:`retrying_session` to reuse its pooled
+    connections across requests; otherwise a one-off session is created and
+    closed, and ``max_retries`` applies to it.
     """
 
-    retry = Retry(
-        total=max_retries,
-        backoff_factor=0.3,
-        status_forcelist=[429, 500, 502, 503, 504],
-        allowed_methods=["GET"],
-    )
-    adapter = HTTPAdapter(max_retries=retry)
-    with requests.Session() as session:
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
+    if session is not None:
         response = session.get(url, timeout=timeout, **kwargs)
-        if not suppress_raise:
-            response.raise_for_status()
+    else:
+        with retrying_session(max_retries=max_retries) as own_session:
+            response = own_session.get(url, timeout=timeout, **kwargs)
+    if not suppress_raise:
+        response.raise_for_status()
     return response
 
 
@@ -1,5 +1,6 @@
 import json
 import logging
+import os
 from unittest.mock import patch
 
 import pytest
@@ -34,6 +35,47 @@ def test_analyze_doc_strips_fences_and_updates_metadata(tmp_path):
     assert meta.extra["steps"]["analysis"] is True
 
 
+@pytest.mark.parametrize(
+    "response, expected",
+    [
+        ('```\n{"foo": 1}\n```', '{"foo": 1}'),
+        ('```json\n{"foo": 1}\n```', '{"foo": 1}'),
+        ('```json\n{"foo": 1}', '```json\n{"foo": 1}'),
+        ('{"foo": 1}', '{"foo": 1}'),
+        ('```json\n{"foo": 1}\n```\nHope this helps', '{"foo": 1}'),
+        ('```json\n{"a": 1}\n```\ntext\n```json\n{"b": 2}\n```', '{"a": 1}'),
+        ("```python\nprint(1)\n```", "```python\nprint(1)\n```"),
+    ],
+)
+def test_strip_code_fence(response, expected):
+    from doc_ai.cli.utils import _strip_code_fence
+
+    assert _strip_code_fence(response) == expected
+
+
+def test_analyze_doc_normalizes_crlf_newlines(tmp_path):
+    doc = tmp_path / "notes.md"
+    doc.write_bytes("# Título\r\nline two\r\n".encode("utf-8"))
+    (tmp_path / "analysis.prompt.yaml").write_text(
+        yaml.dump({"model": "test", "messages": []})
+    )
+    with patch("doc_ai.cli.run_prompt", return_value=("{}", 0.0)) as run:
+        analyze_doc(doc)
+    assert run.call_args.args[1] == "# Título\nline two\n"
+
+
+def test_analyze_doc_plain_markdown_paths(tmp_path):
+    doc = tmp_path / "notes.md"
+    doc.write_text("sample")
+    (tmp_path / "analysis.prompt.yaml").write_text(
+        yaml.dump({"model": "test", "messages": []})
+    )
+    with patch("doc_ai.cli.run_prompt", return_value=("{}", 0.0)):
+        analyze_doc(doc)
+    assert (tmp_path / "notes.analysis.json").exists()
+    assert load_metadata(doc).extra["steps"]["analysis"] is True
+
+
 def test_analyze_doc_reports_success(tmp_path, caplog):
     doc_dir = tmp_path / "sec-form-4"
     doc_dir.mkdir()
@@ -114,6 +156,34 @@ def test_analyze_force_bypasses_metadata(tmp_path):
     assert calls == [True]
 
 
+def test_analyze_doc_uses_stat_before_hashing(tmp_path, monkeypatch):
+    doc_dir = tmp_path / "sample"
+    doc_dir.mkdir()
+    (doc_dir / "analysis.prompt.yaml").write_text(
+        yaml.dump({"model": "test", "messages": []})
+    )
+    raw = doc_dir / "doc.pdf"
+    raw.write_text("raw")
+    md = doc_dir / "doc.pdf.converted.md"
+    md.write_text("sample")
+    with patch("doc_ai.cli.run_prompt", return_value=("{}", 0.0)):
+        analyze_doc(md)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("unexpected call")
+
+    with monkeypatch.context() as m:
+        m.setattr("doc_ai.cli.utils.compute_hash", fail)
+        m.setattr("doc_ai.cli.utils.compute_hash_blake3", fail)
+        with patch("doc_ai.cli.run_prompt", side_effect=fail):
+            analyze_doc(md)
+
+    st = md.stat()
+    os.utime(md, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    with patch("doc_ai.cli.run_prompt", side_effect=fail):
+        analyze_doc(md)
+
+
 def test_analyze_doc_multiple_topics_and_skip(tmp_path):
     doc_dir = tmp_path / "sample"
     doc_dir.mkdir()
@@ -146,6 +216,29 @@ def test_analyze_doc_multiple_topics_and_skip(tmp_path):
     assert calls == []
 
 
+def test_analyze_doc_runs_topics_in_one_call(tmp_path):
+    doc_dir = tmp_path / "sample"
+    doc_dir.mkdir()
+    content = yaml.dump({"model": "test", "messages": []})
+    (doc_dir / "analysis_alpha.prompt.yaml").write_text(content)
+    (doc_dir / "analysis_beta.prompt.yaml").write_text(content)
+    raw = doc_dir / "doc.pdf"
+    raw.write_text("raw")
+    md = doc_dir / "doc.pdf.converted.md"
+    md.write_text("sample")
+    prompts: list[str] = []
+
+    def tracker(prompt_path, text, **kwargs):
+        prompts.append(prompt_path.name)
+        return "{}", 0.0
+
+    with patch("doc_ai.cli.run_prompt", side_effect=tracker):
+        analyze_doc(md, topics=["alpha", "beta"])
+    assert prompts == ["analysis_alpha.prompt.yaml", "analysis_beta.prompt.yaml"]
+    meta = load_metadata(raw)
+    assert set(meta.extra["outputs"]) >= {"analysis:alpha", "analysis:beta"}
+
+
 def test_analyze_cli_handles_generic_error(monkeypatch):
     runner = CliRunner()
 
@@ -172,8 +265,8 @@ def test_analyze_cli_runs_topics(monkeypatch, tmp_path):
     md.write_text("sample")
     calls: list[str | None] = []
 
-    def fake_analyze_doc(path, *args, topic=None, **kwargs):
-        calls.append(topic)
+    def fake_analyze_doc(path, *args, topics=None, **kwargs):
+        calls.extend(topics)
 
     monkeypatch.setattr("doc_ai.cli.analyze.analyze_doc", fake_analyze_doc)
     runner = CliRunner()
@@ -183,3 +276,24 @@ def test_analyze_cli_runs_topics(monkeypatch, tmp_path):
     )
     assert result.exit_code == 0
     assert calls == ["alpha", "beta"]
+
+
+def test_dir_entries_cached_until_directory_changes(tmp_path, monkeypatch):
+    from doc_ai.cli import utils
+
+    (tmp_path / "analysis.prompt.yaml").write_text("")
+    assert utils._dir_entries(tmp_path) == {"analysis.prompt.yaml"}
+
+    def fail(path):
+        raise AssertionError("listing should be cached")
+
+    with monkeypatch.context() as m:
+        m.setattr(utils.os, "scandir", fail)
+        assert utils._dir_entries(tmp_path) == {"analysis.prompt.yaml"}
+
+    (tmp_path / "validate.prompt.yaml").write_text("")
+    assert utils._dir_entries(tmp_path) == {
+        "analysis.prompt.yaml",
+        "validate.prompt.yaml",
+    }
+    assert utils._dir_entries(tmp_path / "missing") == frozenset()
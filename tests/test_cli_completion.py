@@ -1,4 +1,5 @@
 import importlib
+import json
 
 import click
 from prompt_toolkit.document import Document
@@ -140,6 +141,30 @@ def test_safe_env_config_updates_completion(tmp_path, monkeypatch):
     assert "$MY_API_KEY" in completions
 
 
+def test_safe_env_add_and_list(tmp_path, monkeypatch):
+    import doc_ai.cli as cli_mod
+
+    monkeypatch.delenv("DOC_AI_SAFE_ENV_VARS", raising=False)
+    monkeypatch.setattr(cli_mod, "GLOBAL_CONFIG_PATH", tmp_path / "config.json")
+    monkeypatch.setattr(cli_mod, "GLOBAL_CONFIG_DIR", tmp_path)
+    importlib.reload(cli_mod)
+    monkeypatch.setattr(cli_mod, "GLOBAL_CONFIG_PATH", tmp_path / "config.json")
+    monkeypatch.setattr(cli_mod, "GLOBAL_CONFIG_DIR", tmp_path)
+
+    runner = CliRunner()
+    result = runner.invoke(
+        cli_mod.app, ["config", "safe-env", "add", "--", "ZED", "ALPHA", "-SECRET"]
+    )
+    assert result.exit_code == 0
+    saved = json.loads((tmp_path / "config.json").read_text())
+    assert saved["DOC_AI_SAFE_ENV_VARS"].endswith("ZED,-SECRET")
+
+    result = runner.invoke(cli_mod.app, ["config", "safe-env", "list"])
+    assert result.exit_code == 0
+    assert result.output.index("ALPHA") < result.output.index("ZED")
+    assert "SECRET" in result.output
+
+
 def test_completer_suggests_doc_types_and_topics(tmp_path, monkeypatch):
     data_dir = tmp_path / "data"
     (data_dir / "invoice").mkdir(parents=True)
@@ -176,3 +201,23 @@ def test_completer_suggests_urls_doc_types(tmp_path, monkeypatch):
     completions = list(comp.get_completions(Document("urls "), None))
     texts = {c.text for c in completions}
     assert {"alpha", "beta"} <= texts
+
+
+def test_safe_repl_env_filters_by_allow_and_deny(monkeypatch):
+    from doc_ai.cli.interactive import _safe_repl_env
+
+    monkeypatch.setenv("ALPHA", "1")
+    monkeypatch.setenv("BETA", "2")
+    monkeypatch.setenv("GAMMA", "3")
+    env = _safe_repl_env({"DOC_AI_SAFE_ENV_VARS": "GAMMA,ALPHA,BETA,MISSING,-BETA"})
+    assert env == {"ALPHA": "1", "GAMMA": "3"}
+    assert list(env) == ["ALPHA", "GAMMA"]
+
+
+def test_completer_matches_words_case_insensitively():
+    from doc_ai.cli.interactive import _CaseInsensitiveWords
+
+    comp = _CaseInsensitiveWords(["Invoice", "inventory", "report"])
+    completions = list(comp.get_completions(Document("INV"), None))
+    assert [c.text for c in completions] == ["Invoice", "inventory"]
+    assert all(c.start_position == -3 for c in completions)
@@ -2,7 +2,8 @@ import importlib
 import os
 from pathlib import Path
 
-from dotenv import load_dotenv
+import pytest
+from dotenv import dotenv_values, load_dotenv
 from typer.testing import CliRunner
 
 
@@ -26,3 +27,109 @@ def test_config_persists_to_env_file(monkeypatch):
         assert env_path.stat().st_mode & 0o777 == 0o600
         lines = env_path.read_text().strip().splitlines()
         assert "MODEL=foo" in lines and "FAIL_FAST=true" in lines
+
+
+def test_config_set_multiple_pairs_preserves_env_file(monkeypatch):
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        cli = importlib.reload(importlib.import_module("doc_ai.cli"))
+        monkeypatch.setattr(cli, "ENV_FILE", ".env")
+        env_path = Path(".env")
+        env_path.write_text("# project settings\nMODEL=old\nOTHER=1\n")
+        result = runner.invoke(
+            cli.app, ["config", "set", "MODEL=new", "FAIL_FAST=true"]
+        )
+        assert result.exit_code == 0
+        assert env_path.read_text() == (
+            "# project settings\nMODEL=new\nOTHER=1\nFAIL_FAST=true\n"
+        )
+        assert env_path.stat().st_mode & 0o777 == 0o600
+        assert list(Path(".").glob(".env.*.tmp")) == []
+        os.environ.pop("MODEL", None)
+        os.environ.pop("FAIL_FAST", None)
+
+
+def test_config_set_rejects_malformed_pair_before_writing(monkeypatch):
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        cli = importlib.reload(importlib.import_module("doc_ai.cli"))
+        monkeypatch.setattr(cli, "ENV_FILE", ".env")
+        result = runner.invoke(cli.app, ["config", "set", "MODEL=foo", "BROKEN"])
+        assert result.exit_code != 0
+        assert "VAR=VALUE" in result.output
+        assert not Path(".env").exists()
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [("TRUE", True), ("yes", True), ("1", True), ("No", False), ("0", False)],
+)
+def test_parse_value_recognizes_booleans(raw, expected):
+    from doc_ai.cli.config import _parse_value
+
+    assert _parse_value(raw) is expected
+
+
+def test_parse_value_keeps_other_strings():
+    from doc_ai.cli.config import _parse_value
+
+    assert _parse_value("gpt-4o") == "gpt-4o"
+
+
+def test_config_set_suggests_close_key(monkeypatch):
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        cli = importlib.reload(importlib.import_module("doc_ai.cli"))
+        monkeypatch.setattr(cli, "ENV_FILE", ".env")
+        result = runner.invoke(cli.app, ["config", "set", "MODLE=foo"])
+        assert result.exit_code != 0
+        assert "Unknown config key 'MODLE'" in result.output
+        assert "did you mean 'MODEL'?" in result.output
+        assert not Path(".env").exists()
+
+
+def test_config_set_failed_write_keeps_env_file(monkeypatch):
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        cli = importlib.reload(importlib.import_module("doc_ai.cli"))
+        config_mod = importlib.import_module("doc_ai.cli.config")
+        monkeypatch.setattr(cli, "ENV_FILE", ".env")
+        env_path = Path(".env")
+        env_path.write_text("MODEL=old\n")
+
+        def boom(fd):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(config_mod.os, "fsync", boom)
+        result = runner.invoke(cli.app, ["config", "set", "MODEL=new"])
+        assert result.exit_code != 0
+        assert env_path.read_text() == "MODEL=old\n"
+        assert list(Path(".").glob(".env.*.tmp")) == []
+
+
+def test_config_set_replaces_every_binding_of_key(monkeypatch):
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        cli = importlib.reload(importlib.import_module("doc_ai.cli"))
+        monkeypatch.setattr(cli, "ENV_FILE", ".env")
+        env_path = Path(".env")
+        env_path.write_text("MODEL=a\nOTHER=1\nMODEL=b\n")
+        result = runner.invoke(cli.app, ["config", "set", "MODEL=new"])
+        assert result.exit_code == 0
+        assert env_path.read_text() == "MODEL=new\nOTHER=1\nMODEL=new\n"
+        assert dotenv_values(env_path) == {"MODEL": "new", "OTHER": "1"}
+        os.environ.pop("MODEL", None)
+
+
+def test_config_set_keeps_multiline_quoted_values(monkeypatch):
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        cli = importlib.reload(importlib.import_module("doc_ai.cli"))
+        monkeypatch.setattr(cli, "ENV_FILE", ".env")
+        env_path = Path(".env")
+        env_path.write_text('BAR="x\nMODEL=y"\n')
+        result = runner.invoke(cli.app, ["config", "set", "MODEL=z"])
+        assert result.exit_code == 0
+        assert env_path.read_text() == 'BAR="x\nMODEL=y"\nMODEL=z\n'
+        assert dotenv_values(env_path) == {"BAR": "x\nMODEL=y", "MODEL": "z"}
+        os.environ.pop("MODEL", None)
@@ -209,10 +209,10 @@ def test_env_overrides_init_workflows_dest(monkeypatch):
 
         copied = {"called": False}
 
-        def fake_copy2(src, dst):
+        def fake_copyfile(src, dst):
             copied["called"] = True
 
-        monkeypatch.setattr(init_mod.shutil, "copy2", fake_copy2)
+        monkeypatch.setattr(init_mod.shutil, "copyfile", fake_copyfile)
         result = runner.invoke(cli.app, ["init-workflows"])
         assert result.exit_code == 0
         assert Path("wf").exists()
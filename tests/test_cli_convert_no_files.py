@@ -1,6 +1,7 @@
 from typer.testing import CliRunner
 
 from doc_ai.cli import app
+from doc_ai.converter import OutputFormat
 
 
 def test_convert_cli_reports_when_no_files(monkeypatch, tmp_path):
@@ -11,3 +12,30 @@ def test_convert_cli_reports_when_no_files(monkeypatch, tmp_path):
     runner = CliRunner()
     result = runner.invoke(app, ["convert", "-f", "markdown", str(tmp_path)])
     assert "No new files to process." in result.stdout
+
+
+def test_convert_cli_accepts_comma_separated_formats(monkeypatch, tmp_path):
+    seen = {}
+
+    def fake_convert_path(source, fmts, **kwargs):
+        seen["fmts"] = fmts
+        return {}
+
+    monkeypatch.setattr("doc_ai.cli.convert_path", fake_convert_path)
+    runner = CliRunner()
+    result = runner.invoke(
+        app, ["convert", "-f", "markdown,html", "-f", "json", str(tmp_path)]
+    )
+    assert result.exit_code == 0
+    assert seen["fmts"] == [
+        OutputFormat.MARKDOWN,
+        OutputFormat.HTML,
+        OutputFormat.JSON,
+    ]
+
+
+def test_convert_cli_rejects_unknown_format(tmp_path):
+    runner = CliRunner()
+    result = runner.invoke(app, ["convert", "-f", "markdown,pdf", str(tmp_path)])
+    assert result.exit_code != 0
+    assert "Invalid output format 'pdf'" in result.output
@@ -50,10 +50,10 @@ def test_default_doc_type_and_topic(monkeypatch):
             require_json,
             show_cost,
             estimate,
-            topic=None,
+            topics=None,
             force=False,
         ):
-            captured["topic"] = topic
+            (captured["topic"],) = topics
 
         with patch("doc_ai.cli.analyze.analyze_doc", fake_analyze_doc):
             res = runner.invoke(cli.app, ["analyze", "doc.converted.md"])
@@ -13,3 +13,62 @@ def test_cli_help_runs():
         "Orchestrate conversion, validation, analysis and embedding generation."
         in result.stdout
     )
+
+
+def test_subcommand_modules_load_lazily():
+    code = (
+        "import sys\n"
+        "import doc_ai.cli as cli\n"
+        "assert 'doc_ai.cli.query' not in sys.modules\n"
+        "assert cli.query_cmd is sys.modules['doc_ai.cli.query']\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=Path(__file__).resolve().parents[1],
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_package_exports_load_lazily():
+    code = (
+        "import sys\n"
+        "import doc_ai\n"
+        "assert 'doc_ai.github' not in sys.modules\n"
+        "assert callable(doc_ai.run_prompt)\n"
+        "assert 'doc_ai.github' in sys.modules\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=Path(__file__).resolve().parents[1],
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_cli_import_skips_docling():
+    code = (
+        "import sys\n"
+        "import doc_ai.cli as cli\n"
+        "assert 'doc_ai.converter.path' not in sys.modules\n"
+        "assert not any(m.split('.')[0] == 'docling' for m in sys.modules)\n"
+        "assert 'pydantic' not in sys.modules\n"
+        "assert callable(cli.convert_path)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=Path(__file__).resolve().parents[1],
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_cli_shares_rich_console():
+    from rich import get_console
+
+    import doc_ai.cli as cli
+
+    assert cli.console is get_console()
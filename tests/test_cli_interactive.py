@@ -7,7 +7,12 @@ from prompt_toolkit.history import FileHistory
 from typer.main import get_command
 
 from doc_ai.cli import app, interactive_shell
-from doc_ai.cli.interactive import DocAICompleter, _prompt_name
+from doc_ai.cli.interactive import (
+    DocAICompleter,
+    _prompt_name,
+    discover_doc_types_topics,
+    discover_topics,
+)
 
 
 def test_interactive_shell_uses_click_repl(tmp_path, monkeypatch):
@@ -82,3 +87,59 @@ def test_interactive_shell_warns_when_shell_enabled(tmp_path, monkeypatch):
     monkeypatch.setattr("doc_ai.cli.interactive.repl", lambda *a, **k: None)
     with pytest.warns(UserWarning, match="Shell escapes enabled"):
         interactive_shell(app)
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX permissions")
+def test_ensure_private_file_creates_and_tightens(tmp_path):
+    from doc_ai.cli.interactive import _ensure_private_file
+
+    new = tmp_path / "new"
+    _ensure_private_file(new)
+    assert new.stat().st_mode & 0o777 == 0o600
+
+    loose = tmp_path / "loose"
+    loose.write_text("keep")
+    loose.chmod(0o644)
+    _ensure_private_file(loose)
+    assert loose.stat().st_mode & 0o777 == 0o600
+    assert loose.read_text() == "keep"
+
+
+def test_discover_topics_matches_both_prompt_names(tmp_path):
+    doc_dir = tmp_path / "reports"
+    doc_dir.mkdir()
+    for name in (
+        "analysis_risk.prompt.yaml",
+        "reports.analysis.cost.prompt.yaml",
+        "letters.analysis.other.prompt.yaml",
+        "reports.validate.prompt.yaml",
+        "notes.md",
+    ):
+        (doc_dir / name).write_text("")
+    assert discover_topics("reports", tmp_path) == ["cost", "risk"]
+    assert discover_topics("missing", tmp_path) == []
+
+
+def test_discover_doc_types_topics_tracks_changes(tmp_path, monkeypatch):
+    import doc_ai.cli.interactive as interactive
+
+    data = tmp_path / "data"
+    (data / "reports").mkdir(parents=True)
+    (data / "reports" / "analysis_risk.prompt.yaml").write_text("")
+    assert discover_doc_types_topics(data) == (["reports"], ["risk"])
+
+    calls: list[str] = []
+    original = interactive.discover_topics
+
+    def counting(doc_type, data_dir):
+        calls.append(doc_type)
+        return original(doc_type, data_dir)
+
+    monkeypatch.setattr(interactive, "discover_topics", counting)
+    assert discover_doc_types_topics(data) == (["reports"], ["risk"])
+    assert calls == []
+
+    (data / "reports" / "reports.analysis.cost.prompt.yaml").write_text("")
+    (data / "letters").mkdir()
+    assert discover_doc_types_topics(data) == (["letters", "reports"], ["cost", "risk"])
+    assert sorted(calls) == ["letters", "reports"]
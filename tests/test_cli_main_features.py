@@ -115,3 +115,18 @@ def test_logging_configuration(monkeypatch):
     recorded.clear()
     result = runner.invoke(app, ["--verbose", "config", "show"])
     assert recorded["level"] == "DEBUG"
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("1", True),
+        (" Yes ", True),
+        ("on", True),
+        ("0", False),
+        ("", False),
+        (None, False),
+    ],
+)
+def test_is_truthy(value, expected):
+    assert cli_module._is_truthy(value) is expected
@@ -1,4 +1,5 @@
 import sys
+from pathlib import Path
 
 import pytest
 
@@ -39,3 +40,23 @@ def test_run_option_propagates_exit(monkeypatch, tmp_path):
     monkeypatch.setattr(sys, "argv", ["cli.py", "--run", str(script)])
     with pytest.raises(SystemExit):
         cli_module.main()
+
+
+def test_extract_path_flags_single_pass():
+    args, flags = cli_module._extract_path_flags(
+        ["--run=a.txt", "--verbose", "--batch", "b.txt", "convert", "--run", "c"]
+    )
+    assert args == ["--verbose", "convert", "--run", "c"]
+    assert flags == {"--run": Path("a.txt"), "--batch": Path("b.txt")}
+
+
+def test_extract_path_flags_requires_value():
+    with pytest.raises(SystemExit):
+        cli_module._extract_path_flags(["--init"])
+
+
+def test_extract_path_flags_rejects_init_and_batch(caplog):
+    with pytest.raises(SystemExit) as excinfo:
+        cli_module._extract_path_flags(["--init", "a.txt", "--batch=b.txt"])
+    assert excinfo.value.code == 1
+    assert "cannot be used together" in caplog.text
@@ -18,5 +18,5 @@ def test_doctags_extension_mapping_only_intended():
 def test_infer_format_doctags_and_rejects_dogtags():
     """infer_format accepts .doctags and rejects .dogtags."""
     assert infer_format(Path("file.doctags")) == OutputFormat.DOCTAGS
-    with pytest.raises(typer.BadParameter):
+    with pytest.raises(typer.BadParameter, match=r"Expected one of: \.md, \.html"):
         infer_format(Path("file.dogtags"))
@@ -0,0 +1,130 @@
+import json
+from pathlib import Path
+
+import pytest
+
+import doc_ai.cli as cli
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_global_config_round_trip(monkeypatch, tmp_path, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(cli, "orjson", None)
+    elif cli.orjson is None:
+        pytest.skip("orjson not installed")
+    cfg_path = tmp_path / "config.json"
+    monkeypatch.setattr(cli, "GLOBAL_CONFIG_DIR", tmp_path)
+    monkeypatch.setattr(cli, "GLOBAL_CONFIG_PATH", cfg_path)
+
+    cli.save_global_config({"MODEL": "gpt-4o", "FAIL_FAST": True})
+
+    assert json.loads(cfg_path.read_text()) == {"MODEL": "gpt-4o", "FAIL_FAST": True}
+    assert cli.load_global_config() == {"MODEL": "gpt-4o", "FAIL_FAST": True}
+    assert cfg_path.read_text().index("FAIL_FAST") < cfg_path.read_text().index("MODEL")
+    assert [p.name for p in tmp_path.iterdir()] == ["config.json"]
+
+
+def test_global_config_failed_write_keeps_previous(monkeypatch, tmp_path):
+    cfg_path = tmp_path / "config.json"
+    cfg_path.write_text('{"MODEL": "gpt-4o"}')
+    monkeypatch.setattr(cli, "GLOBAL_CONFIG_DIR", tmp_path)
+    monkeypatch.setattr(cli, "GLOBAL_CONFIG_PATH", cfg_path)
+
+    def boom(fd):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(cli.os, "fsync", boom)
+    with pytest.raises(OSError):
+        cli.save_global_config({"MODEL": "gpt-4.1"})
+    assert json.loads(cfg_path.read_text()) == {"MODEL": "gpt-4o"}
+    assert [p.name for p in tmp_path.iterdir()] == ["config.json"]
+
+
+def test_find_global_config_prefers_json(tmp_path):
+    assert cli._find_global_config(tmp_path) == tmp_path / "config.json"
+    (tmp_path / "config.yml").write_text("MODEL: gpt-4o\n")
+    assert cli._find_global_config(tmp_path) == tmp_path / "config.yml"
+    (tmp_path / "config.json").write_text("{}")
+    assert cli._find_global_config(tmp_path) == tmp_path / "config.json"
+
+
+def test_load_yaml_global_config(monkeypatch, tmp_path):
+    cfg_path = tmp_path / "config.yaml"
+    cfg_path.write_text("MODEL: gpt-4o\n")
+    monkeypatch.setattr(cli, "GLOBAL_CONFIG_PATH", cfg_path)
+    assert cli.load_global_config() == {"MODEL": "gpt-4o"}
+
+
+def test_load_global_config_missing_or_invalid(monkeypatch, tmp_path):
+    cfg_path = tmp_path / "config.json"
+    monkeypatch.setattr(cli, "GLOBAL_CONFIG_PATH", cfg_path)
+    assert cli.load_global_config() == {}
+    cfg_path.write_text("{not json")
+    assert cli.load_global_config() == {}
+
+
+def test_yaml_global_config_round_trip(monkeypatch, tmp_path):
+    cfg_path = tmp_path / "config.yml"
+    monkeypatch.setattr(cli, "GLOBAL_CONFIG_DIR", tmp_path)
+    monkeypatch.setattr(cli, "GLOBAL_CONFIG_PATH", cfg_path)
+    cli.save_global_config({"MODEL": "gpt-4o", "BASE_MODEL_URL": "https://x"})
+    assert cli.load_global_config() == {
+        "MODEL": "gpt-4o",
+        "BASE_MODEL_URL": "https://x",
+    }
+
+
+def test_read_configs_reuses_parsed_files(monkeypatch, tmp_path):
+    cfg_path = tmp_path / "config.json"
+    cfg_path.write_text('{"MODEL": "gpt-4o"}')
+    monkeypatch.setattr(cli, "GLOBAL_CONFIG_DIR", tmp_path)
+    monkeypatch.setattr(cli, "GLOBAL_CONFIG_PATH", cfg_path)
+    monkeypatch.setattr(cli, "ENV_FILE", str(tmp_path / ".env"))
+    cli._invalidate_config_cache()
+    calls: list[int] = []
+    original = cli.load_global_config
+
+    def counting_load() -> dict[str, str]:
+        calls.append(1)
+        return original()
+
+    monkeypatch.setattr(cli, "load_global_config", counting_load)
+    first = cli.read_configs()
+    second = cli.read_configs()
+    assert first == second
+    assert len(calls) == 1
+
+    cli.save_global_config({"MODEL": "gpt-4.1"})
+    global_cfg, _env, _merged = cli.read_configs()
+    assert len(calls) == 2
+    assert global_cfg == {"MODEL": "gpt-4.1"}
+
+
+def test_cached_dotenv_values_reparses_on_change(monkeypatch, tmp_path):
+    env_path = tmp_path / ".env"
+    env_path.write_text("MODEL=gpt-4o\n")
+    calls: list[str] = []
+    original = cli.dotenv_values
+
+    def counting_values(path):
+        calls.append(path)
+        return original(path)
+
+    monkeypatch.setattr(cli, "dotenv_values", counting_values)
+    assert cli._cached_dotenv_values(env_path) == {"MODEL": "gpt-4o"}
+    assert cli._cached_dotenv_values(env_path) == {"MODEL": "gpt-4o"}
+    assert len(calls) == 1
+
+    env_path.write_text("MODEL=gpt-4.1-mini\n")
+    assert cli._cached_dotenv_values(env_path) == {"MODEL": "gpt-4.1-mini"}
+    assert len(calls) == 2
+    assert cli._cached_dotenv_values(tmp_path / "missing.env") == {}
+
+
+def test_find_env_file_sees_new_parent_env(monkeypatch, tmp_path):
+    sub = tmp_path / "sub"
+    sub.mkdir()
+    monkeypatch.chdir(sub)
+    assert cli._find_env_file() == ".env"
+    (tmp_path / ".env").write_text("MODEL=gpt-4o\n")
+    assert Path(cli._find_env_file()) == tmp_path / ".env"
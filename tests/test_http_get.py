@@ -64,3 +64,39 @@ def test_http_get_suppress(monkeypatch):
     resp = http_get("http://example.com", suppress_raise=True)
     assert isinstance(resp, DummyResponse)
     assert not resp.called
+
+
+def test_http_get_reuses_given_session(monkeypatch):
+    class DummyResponse:
+        def raise_for_status(self) -> None:
+            pass
+
+    class DummySession:
+        def __init__(self) -> None:
+            self.urls: list[str] = []
+
+        def get(self, url, timeout=0, **kwargs):
+            self.urls.append(url)
+            return DummyResponse()
+
+        def close(self):  # pragma: no cover - must not be called
+            raise AssertionError("caller-owned session closed")
+
+    def no_new_session():  # pragma: no cover - must not be called
+        raise AssertionError("unexpected session")
+
+    monkeypatch.setattr("doc_ai.utils.requests.Session", no_new_session)
+
+    session = DummySession()
+    http_get("http://example.com/a", session=session)
+    http_get("http://example.com/b", session=session)
+    assert session.urls == ["http://example.com/a", "http://example.com/b"]
+
+
+def test_retrying_session_mounts_pooled_adapter():
+    from doc_ai.utils import retrying_session
+
+    with retrying_session(pool_maxsize=4) as session:
+        adapter = session.get_adapter("https://example.com")
+        assert adapter._pool_maxsize == 4
+        assert adapter.max_retries.total == 3
@@ -0,0 +1,26 @@
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from doc_ai.cli import app
+from doc_ai.cli.init_workflows import _template_files
+
+
+def test_init_workflows_copies_templates_and_skips_existing():
+    templates = _template_files()
+    assert templates
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        dest = Path("wf")
+        dest.mkdir()
+        kept = dest / templates[0].name
+        kept.write_text("custom")
+
+        result = runner.invoke(app, ["init-workflows", "--dest", str(dest)])
+
+        assert result.exit_code == 0, result.output
+        assert kept.read_text() == "custom"
+        assert f"Skipping {kept} (exists)" in result.output
+        assert sorted(p.name for p in dest.iterdir()) == sorted(
+            t.name for t in templates
+        )
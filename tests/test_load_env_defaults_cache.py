@@ -12,3 +12,21 @@ def test_load_env_defaults_is_cached(monkeypatch):
     assert first is second
     mock.assert_called_once()
     load_env_defaults.cache_clear()
+
+
+def test_config_show_does_not_mutate_cached_defaults(monkeypatch, tmp_path):
+    from typer.testing import CliRunner
+
+    from doc_ai.cli import app
+
+    load_env_defaults.cache_clear()
+    monkeypatch.setattr(
+        "doc_ai.cli.utils.dotenv_values", MagicMock(return_value={"A": "1"})
+    )
+    monkeypatch.setenv("MODEL_PRICE_TEST", "1")
+    monkeypatch.chdir(tmp_path)
+    result = CliRunner().invoke(app, ["config", "show"])
+    assert result.exit_code == 0
+    assert "MODEL_PRICE_TEST" in result.stdout
+    assert load_env_defaults() == {"A": "1"}
+    load_env_defaults.cache_clear()
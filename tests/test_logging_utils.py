@@ -35,3 +35,13 @@ def test_redaction(tmp_path):
     assert expected_github in text
     assert openai_token not in text
     assert github_token not in text
+
+
+def test_reconfigure_with_same_settings_keeps_handlers(tmp_path):
+    log_path = tmp_path / "same.log"
+    configure_logging("INFO", log_path)
+    handlers = list(logging.getLogger().handlers)
+    configure_logging("INFO", log_path)
+    assert logging.getLogger().handlers == handlers
+    configure_logging("DEBUG", log_path)
+    assert logging.getLogger().handlers != handlers
@@ -1,6 +1,14 @@
+import datetime
+import hashlib
 import logging
 
-from doc_ai.metadata import load_metadata, mark_step, save_metadata
+from doc_ai.metadata import (
+    compute_hash,
+    load_metadata,
+    mark_step,
+    metadata_path,
+    save_metadata,
+)
 from doc_ai.metadata.dublin_core import DublinCoreDocument
 
 
@@ -35,3 +43,129 @@ def test_decode_content_invalid_logs_warning(caplog):
     with caplog.at_level(logging.WARNING):
         assert DublinCoreDocument.decode_content("!!!") is None
     assert "Failed to decode content" in caplog.text
+
+
+def test_compute_hash_matches_for_mmap_and_small_files(tmp_path):
+    small = tmp_path / "small.bin"
+    small.write_bytes(b"x" * 10)
+    large = tmp_path / "large.bin"
+    data = bytes(range(256)) * 1024
+    large.write_bytes(data)
+    empty = tmp_path / "empty.bin"
+    empty.write_bytes(b"")
+    assert compute_hash(small) == hashlib.blake2b(b"x" * 10).hexdigest()
+    assert compute_hash(large) == hashlib.blake2b(data).hexdigest()
+    assert compute_hash(empty) == hashlib.blake2b(b"").hexdigest()
+
+
+def test_refresh_hashes_prefers_blake3_when_available(tmp_path, monkeypatch):
+    import doc_ai.metadata as metadata
+
+    doc = tmp_path / "doc.pdf"
+    doc.write_bytes(b"original")
+    monkeypatch.setattr(
+        metadata,
+        "compute_hash_blake3",
+        lambda path: hashlib.sha256(path.read_bytes()).hexdigest(),
+    )
+    meta = DublinCoreDocument()
+    assert not metadata.refresh_hashes(meta, doc)
+    assert meta.blake2b == compute_hash(doc)
+    assert meta.blake3 == hashlib.sha256(b"original").hexdigest()
+
+    def fail(path):
+        raise AssertionError("blake2b should not be computed")
+
+    monkeypatch.setattr(metadata, "compute_hash", fail)
+    mark_step(meta, "validation")
+    assert metadata.refresh_hashes(meta, doc)
+    assert meta.extra["steps"] == {"validation": True}
+
+
+def test_refresh_hashes_falls_back_to_blake2b(tmp_path, monkeypatch):
+    import doc_ai.metadata as metadata
+
+    monkeypatch.setattr(metadata, "compute_hash_blake3", lambda path: None)
+    doc = tmp_path / "doc.pdf"
+    doc.write_bytes(b"original")
+    meta = DublinCoreDocument(blake2b=compute_hash(doc))
+    mark_step(meta, "validation")
+    assert metadata.refresh_hashes(meta, doc)
+    assert meta.blake3 is None
+    doc.write_bytes(b"changed")
+    assert not metadata.refresh_hashes(meta, doc)
+    assert meta.blake2b == compute_hash(doc)
+    assert meta.extra == {}
+
+
+def test_save_metadata_skips_unchanged_write(tmp_path, monkeypatch):
+    doc = tmp_path / "file.txt"
+    doc.write_text("hello", encoding="utf-8")
+    meta = load_metadata(doc)
+    save_metadata(doc, meta)
+    meta_file = metadata_path(doc)
+    original = meta_file.read_bytes()
+
+    def fail(self, data):
+        raise AssertionError("unchanged metadata should not be rewritten")
+
+    with monkeypatch.context() as m:
+        m.setattr(type(meta_file), "write_bytes", fail)
+        save_metadata(doc, load_metadata(doc))
+    assert meta_file.read_bytes() == original
+
+    meta = load_metadata(doc)
+    mark_step(meta, "conversion")
+    save_metadata(doc, meta)
+    assert load_metadata(doc).extra["steps"] == {"conversion": True}
+
+
+def test_metadata_json_format_independent_of_orjson(monkeypatch):
+    from doc_ai.metadata import dublin_core
+
+    meta = DublinCoreDocument(
+        title="Résumé",
+        content=b"body",
+        date_created=datetime.datetime(2024, 1, 2, 3, 4, 5, 6),
+        extra={"steps": {"conversion": True}, "outputs": {"x": ["a", "b"]}},
+        size=3,
+    )
+    data = meta.to_json_bytes()
+    assert data == meta.to_json().encode("utf-8")
+    assert '"title": "R\\u00e9sum\\u00e9"' in meta.to_json()
+    assert meta.to_json().startswith('{\n    "')
+    for module in (dublin_core.orjson, None):
+        monkeypatch.setattr(dublin_core, "orjson", module)
+        loaded = DublinCoreDocument.from_json(data)
+        assert loaded.title == "Résumé"
+        assert loaded.content == b"body"
+        assert loaded.date_created == meta.date_created
+
+
+def test_compute_hashes_matches_compute_hash(tmp_path):
+    from doc_ai.metadata import compute_hashes
+
+    paths = []
+    for i in range(5):
+        path = tmp_path / f"doc{i}.bin"
+        path.write_bytes(bytes([i]) * (i * 70_000))
+        paths.append(path)
+    assert compute_hashes(paths) == {p: compute_hash(p) for p in paths}
+    assert compute_hashes([]) == {}
+
+
+def test_refresh_hashes_uses_precomputed_hash(tmp_path, monkeypatch):
+    import doc_ai.metadata as metadata
+
+    doc = tmp_path / "doc.pdf"
+    doc.write_bytes(b"original")
+    file_hash = compute_hash(doc)
+    monkeypatch.setattr(metadata, "compute_hash_blake3", lambda path: None)
+
+    def fail(path):
+        raise AssertionError("hash was precomputed")
+
+    monkeypatch.setattr(metadata, "compute_hash", fail)
+    meta = DublinCoreDocument()
+    assert not metadata.refresh_hashes(meta, doc, file_hash)
+    assert meta.blake2b == file_hash
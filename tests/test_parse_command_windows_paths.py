@@ -1,5 +1,7 @@
 import click
+import pytest
 from click.testing import CliRunner
+from click_repl.exceptions import CommandLineParserError
 
 from doc_ai.batch import _parse_command
 
@@ -20,3 +22,23 @@ def test_parse_command_windows_path_roundtrip():
     result = runner.invoke(show, [win_path])
     assert result.exit_code == 0
     assert result.stdout.strip() == win_path
+
+
+def test_parse_command_unquoted_matches_shlex():
+    command = r"convert  C:\data\report.pdf --format markdown"
+    assert _parse_command(command) == [
+        "convert",
+        r"C:\data\report.pdf",
+        "--format",
+        "markdown",
+    ]
+
+
+def test_parse_command_unclosed_quote_raises():
+    with pytest.raises(CommandLineParserError):
+        _parse_command('show "unterminated')
+
+
+def test_parse_command_unquoted_keeps_unicode_whitespace():
+    command = "show a\xa0b\u2003c  d"
+    assert _parse_command(command) == ["show", "a\xa0b\u2003c", "d"]
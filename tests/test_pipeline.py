@@ -1,7 +1,11 @@
 import importlib
 import logging
+import threading
+import time
 from pathlib import Path
 
+import pytest
+import typer
 from typer.testing import CliRunner
 
 from doc_ai.cli import app
@@ -149,6 +153,23 @@ def test_pipeline_workers_option(monkeypatch, tmp_path):
     assert captured_build["workers"] == 3
 
 
+def test_pipeline_fail_fast_overlaps_workers(monkeypatch, tmp_path):
+    src = _setup_docs(tmp_path)
+    barrier = threading.Barrier(2, timeout=5)
+
+    def fake_validate(raw, md, fmt, prompt, model, base_url, **kwargs):
+        # Both documents must be in flight at once for the barrier to release.
+        barrier.wait()
+
+    monkeypatch.setattr("doc_ai.cli.validate_doc", fake_validate)
+    monkeypatch.setattr("doc_ai.cli.analyze_doc", lambda *a, **k: None)
+    monkeypatch.setattr("doc_ai.cli.convert_path", lambda *a, **k: None)
+    monkeypatch.setattr("doc_ai.cli.build_vector_store", lambda *a, **k: None)
+
+    run_pipeline(src, workers=2, fail_fast=True)
+    assert not barrier.broken
+
+
 def test_pipeline_dry_run(monkeypatch, tmp_path, caplog):
     src = _setup_docs(tmp_path)
     calls: list[str] = []
@@ -191,3 +212,31 @@ def test_pipeline_runs_topics(monkeypatch, tmp_path):
     for name in ["a.pdf.converted.md", "b.pdf.converted.md"]:
         assert (name, "alpha") in calls
         assert (name, "beta") in calls
+
+
+def test_pipeline_fail_fast_starts_no_documents_after_failure(monkeypatch, tmp_path):
+    src = tmp_path / "src"
+    src.mkdir()
+    for name in ["a.pdf", "b.pdf", "c.pdf", "d.pdf", "e.pdf"]:
+        (src / name).touch()
+        (src / f"{name}.converted.md").touch()
+    started: list[str] = []
+    failed = threading.Event()
+
+    def fake_validate(raw, md, fmt, prompt, model, base_url, **kwargs):
+        started.append(Path(raw).name)
+        if len(started) == 1:
+            failed.set()
+            raise RuntimeError("boom")
+        # The other in-flight document finishes only after the failure.
+        failed.wait(timeout=5)
+        time.sleep(0.1)
+
+    monkeypatch.setattr("doc_ai.cli.validate_doc", fake_validate)
+    monkeypatch.setattr("doc_ai.cli.analyze_doc", lambda *a, **k: None)
+    monkeypatch.setattr("doc_ai.cli.convert_path", lambda *a, **k: None)
+    monkeypatch.setattr("doc_ai.cli.build_vector_store", lambda *a, **k: None)
+
+    with pytest.raises(typer.Exit):
+        run_pipeline(src, workers=2, fail_fast=True)
+    assert len(started) == 2
@@ -108,3 +108,67 @@ def test_dummy_plugin_trust_required(monkeypatch, tmp_path):
     monkeypatch.setattr(metadata, "entry_points", original)
     importlib.reload(cli)
     monkeypatch.delitem(sys.modules, "dummy_plugin", raising=False)
+
+
+def test_plugins_register_on_dispatch(monkeypatch, tmp_path):
+    from typer.testing import CliRunner
+
+    dummy = types.ModuleType("dummy_plugin")
+    dummy.app = typer.Typer()
+
+    @dummy.app.command()
+    def hello() -> None:
+        typer.echo("hello from plugin")
+
+    monkeypatch.setitem(sys.modules, "dummy_plugin", dummy)
+
+    class DummyDist:
+        metadata = {"Name": "dummy"}
+        version = "1.0"
+
+        def locate_file(self, *_):
+            return tmp_path
+
+    class DummyEntryPoint:
+        name = "dummy"
+        dist = DummyDist()
+
+        def load(self):
+            return dummy.app
+
+    import importlib.metadata as metadata
+
+    original = metadata.entry_points
+    monkeypatch.setattr(
+        metadata, "entry_points", lambda group=None: [DummyEntryPoint()]
+    )
+
+    import doc_ai.cli as cli
+
+    importlib.reload(cli)
+    monkeypatch.setattr(
+        cli,
+        "read_configs",
+        lambda: (
+            {},
+            {},
+            {
+                "DOC_AI_TRUSTED_PLUGINS": "dummy==1.0",
+                "DOC_AI_TRUSTED_PLUGIN_HASHES": (
+                    f"dummy={hashlib.sha256(b'').hexdigest()}"
+                ),
+            },
+        ),
+    )
+    runner = CliRunner()
+    result = runner.invoke(cli.app, ["--version"])
+    assert result.exit_code == 0
+    assert not cli._LOADED_PLUGINS
+
+    result = runner.invoke(cli.app, ["dummy", "hello"])
+    assert result.exit_code == 0, result.output
+    assert "hello from plugin" in result.output
+
+    monkeypatch.setattr(metadata, "entry_points", original)
+    importlib.reload(cli)
+    monkeypatch.delitem(sys.modules, "dummy_plugin", raising=False)
@@ -0,0 +1,48 @@
+import hashlib
+
+import doc_ai.cli as cli
+
+
+class _Dist:
+    def __init__(self, root):
+        self._root = root
+
+    def locate_file(self, *_):
+        return self._root
+
+
+def test_hash_distribution_covers_all_files_in_path_order(tmp_path):
+    root = tmp_path / "dist"
+    (root / "pkg" / "__pycache__").mkdir(parents=True)
+    (root / "pkg" / "__init__.py").write_bytes(b"a = 1\n")
+    (root / "pkg" / "__pycache__" / "__init__.pyc").write_bytes(b"bytecode")
+    (root / "pkg-1.0.dist-info").mkdir()
+    (root / "pkg-1.0.dist-info" / "RECORD").write_bytes(b"record")
+
+    expected = hashlib.sha256()
+    for path in sorted(p for p in root.rglob("*") if p.is_file()):
+        expected.update(path.read_bytes())
+    assert cli._hash_distribution(_Dist(root)) == expected.digest()
+
+
+def test_hash_distribution_recomputes_after_change(tmp_path):
+    root = tmp_path / "dist"
+    root.mkdir()
+    target = root / "a.py"
+    target.write_bytes(b"a = 1\n")
+    assert cli._hash_distribution(_Dist(root)) == hashlib.sha256(b"a = 1\n").digest()
+
+    target.write_bytes(b"a = 2\n")
+    assert cli._hash_distribution(_Dist(root)) == hashlib.sha256(b"a = 2\n").digest()
+
+
+def test_hash_distribution_chunked_fallback(monkeypatch, tmp_path):
+    root = tmp_path / "dist"
+    root.mkdir()
+    (root / "a.py").write_bytes(b"a" * 3_000_000)
+    (root / "b.py").write_bytes(b"b = 2\n")
+    expected = hashlib.sha256(b"a" * 3_000_000 + b"b = 2\n").digest()
+    assert cli._hash_distribution(_Dist(root)) == expected
+
+    monkeypatch.delattr(hashlib, "file_digest", raising=False)
+    assert cli._hash_distribution(_Dist(root)) == expected
@@ -1,15 +1,19 @@
+import io
 import time
 from pathlib import Path
 
+import pytest
 from typer.testing import CliRunner
 
 from doc_ai.cli import app
 from doc_ai.cli.convert import download_and_convert
+from doc_ai.cli.manage_urls import _valid_url, save_urls
 
 
 class DummyResp:
     def __init__(self, data: bytes) -> None:
         self.data = data
+        self.raw = io.BytesIO(data)
 
     def raise_for_status(self) -> None:  # pragma: no cover - no errors
         return
@@ -24,7 +28,7 @@ class DummyResp:
 
 
 def _mock_http_get(url_map):
-    def _get(url, stream=True):  # noqa: D401 - mimics http_get signature
+    def _get(url, stream=True, **kwargs):  # noqa: D401 - mimics http_get signature
         return DummyResp(url_map[url])
 
     return _get
@@ -65,6 +69,67 @@ def test_convert_downloads_multiple_urls(tmp_path, monkeypatch):
     assert called == [dest]
 
 
+def test_convert_reads_urls_file(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    urls = {
+        "http://example.com/a.txt": b"a",
+        "http://example.com/b.txt": b"b",
+    }
+    monkeypatch.setattr("doc_ai.cli.convert.http_get", _mock_http_get(urls))
+    monkeypatch.setattr("doc_ai.cli.convert_path", lambda path, fmts, force=False: {})
+    url_file = tmp_path / "urls.txt"
+    url_file.write_text(
+        "  http://example.com/a.txt  \n\n\thttp://example.com/b.txt\n",
+        encoding="utf-8",
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(
+        app, ["convert", "--doc-type", "reports", "--urls", str(url_file)]
+    )
+    assert result.exit_code == 0, result.output
+    dest = Path("data/reports")
+    assert (dest / "a.txt").read_bytes() == b"a"
+    assert (dest / "b.txt").read_bytes() == b"b"
+
+
+def test_download_and_convert_skips_duplicate_urls(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    fetched = []
+
+    def _get(url, stream=True, **kwargs):
+        fetched.append(url)
+        return DummyResp(b"a")
+
+    monkeypatch.setattr("doc_ai.cli.convert.http_get", _get)
+    monkeypatch.setattr("doc_ai.cli.convert_path", lambda path, fmts, force=False: {})
+
+    url = "http://example.com/a.txt"
+    download_and_convert([url, url, url], "reports", [], False)
+
+    assert fetched == [url]
+    assert sorted(p.name for p in Path("data/reports").iterdir()) == ["a.txt"]
+
+
+def test_download_and_convert_shares_one_session(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    sessions = []
+
+    def _get(url, stream=True, session=None):
+        sessions.append(session)
+        return DummyResp(b"x")
+
+    monkeypatch.setattr("doc_ai.cli.convert.http_get", _get)
+    monkeypatch.setattr("doc_ai.cli.convert_path", lambda path, fmts, force=False: {})
+
+    download_and_convert(
+        ["http://example.com/a.txt", "http://example.com/b.txt"], "reports", [], False
+    )
+
+    assert len(sessions) == 2
+    assert sessions[0] is not None and sessions[0] is sessions[1]
+
+
 def test_add_url_command(tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
     monkeypatch.setattr(
@@ -119,6 +184,8 @@ def test_add_urls_command(tmp_path, monkeypatch):
     runner = CliRunner()
     result = runner.invoke(app, ["add", "urls", str(url_file), "--doc-type", "letters"])
     assert result.exit_code == 0, result.output
+    assert "Skipping invalid URL: not-a-url" in result.output
+    assert "Skipping duplicate URL: http://example.com/a.txt" in result.output
     dest = Path("data/letters")
     assert (dest / "a.txt").read_bytes() == b"a"
     assert (dest / "b.txt").read_bytes() == b"b"
@@ -463,7 +530,7 @@ def test_download_parallel_execution(tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
     urls = ["http://example.com/a.txt", "http://example.com/b.txt"]
 
-    def slow_http_get(u, stream=True):
+    def slow_http_get(u, stream=True, **kwargs):
         time.sleep(0.2)
         return DummyResp(b"x")
 
@@ -474,3 +541,51 @@ def test_download_parallel_execution(tmp_path, monkeypatch):
     download_and_convert(urls, "reports", [], False)
     elapsed = time.perf_counter() - start
     assert elapsed < 0.35
+
+
+def test_download_failure_leaves_no_partial_file(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    class BrokenRaw(io.BytesIO):
+        def read(self, size: int = -1) -> bytes:
+            if self.tell():
+                raise OSError("connection reset")
+            return super().read(1)
+
+    class BrokenResp(DummyResp):
+        def __init__(self) -> None:
+            super().__init__(b"partial")
+            self.raw = BrokenRaw(b"partial")
+
+    monkeypatch.setattr(
+        "doc_ai.cli.convert.http_get", lambda u, stream=True, **kwargs: BrokenResp()
+    )
+    monkeypatch.setattr("doc_ai.cli.convert_path", lambda path, fmts, force=False: {})
+
+    with pytest.raises(OSError):
+        download_and_convert(["http://example.com/a.txt"], "reports", [], False)
+    assert list(Path("data/reports").iterdir()) == []
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("http://example.com", True),
+        ("HTTPS://example.com/a.pdf?x=1", True),
+        ("ftp://example.com", False),
+        ("http://", False),
+        ("http:///path", False),
+        ("example.com", False),
+    ],
+)
+def test_valid_url(url, expected):
+    assert _valid_url(url) is expected
+
+
+def test_save_urls_replaces_file_atomically(tmp_path):
+    path = tmp_path / "reports" / "urls.txt"
+    save_urls(path, ["http://a", "http://b", "HTTP://A"])
+    assert path.read_text() == "http://a\nhttp://b\n"
+    save_urls(path, [])
+    assert path.read_text() == ""
+    assert [p.name for p in path.parent.iterdir()] == ["urls.txt"]
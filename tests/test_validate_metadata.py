@@ -104,3 +104,35 @@ def test_validate_force_bypasses_metadata(tmp_path):
         force=True,
     )
     assert calls == [True]
+
+
+def test_validate_doc_skips_hash_when_stat_unchanged(tmp_path, monkeypatch):
+    raw, rendered, prompt = _create_files(tmp_path)
+
+    def good_validate_file(raw_p, rendered_p, fmt, prompt_p, **kwargs):
+        return {"match": True}
+
+    validate_doc(
+        raw,
+        rendered,
+        fmt=OutputFormat.MARKDOWN,
+        prompt=prompt,
+        validate_file_func=good_validate_file,
+    )
+    st = raw.stat()
+    assert load_metadata(raw).extra["inputs"]["validation"]["stat"] == [
+        st.st_size,
+        st.st_mtime_ns,
+    ]
+
+    def fail(*args, **kwargs):
+        raise AssertionError("unexpected call")
+
+    monkeypatch.setattr("doc_ai.cli.utils.refresh_hashes", fail)
+    validate_doc(
+        raw,
+        rendered,
+        fmt=OutputFormat.MARKDOWN,
+        prompt=prompt,
+        validate_file_func=fail,
+    )